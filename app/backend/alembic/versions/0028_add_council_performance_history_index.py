@@ -0,0 +1,30 @@
+"""Add composite index for council performance history lookups.
+
+Revision ID: 0028
+Revises: 0027
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0028"
+down_revision = "0027"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add (council_id, timestamp) index for time-bounded history queries."""
+    op.create_index(
+        "ix_council_performance_council_id_timestamp",
+        "council_performance",
+        ["council_id", "timestamp"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove (council_id, timestamp) index."""
+    op.drop_index("ix_council_performance_council_id_timestamp", table_name="council_performance")
@@ -0,0 +1,32 @@
+"""Add composite index for paginated flow run listings.
+
+Revision ID: 0029
+Revises: 0028
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0029"
+down_revision = "0028"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add (flow_id, id DESC) index so newest-first run pages are served by an index scan."""
+    op.create_index(
+        "ix_hedge_fund_flow_runs_flow_id_id_desc",
+        "hedge_fund_flow_runs",
+        ["flow_id", sa.text("id DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove (flow_id, id DESC) index."""
+    op.drop_index("ix_hedge_fund_flow_runs_flow_id_id_desc", table_name="hedge_fund_flow_runs")
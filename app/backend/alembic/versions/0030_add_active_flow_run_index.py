@@ -0,0 +1,37 @@
+"""Add partial index for active flow run lookups.
+
+Revision ID: 0030
+Revises: 0029
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0030"
+down_revision = "0029"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add partial index on flow_id covering only active runs."""
+    op.create_index(
+        "ix_hedge_fund_flow_runs_active_flow_id",
+        "hedge_fund_flow_runs",
+        ["flow_id"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('RUNNING', 'IN_PROGRESS', 'STARTED')"),
+    )
+
+
+def downgrade() -> None:
+    """Remove partial active-run index."""
+    op.drop_index(
+        "ix_hedge_fund_flow_runs_active_flow_id",
+        table_name="hedge_fund_flow_runs",
+        postgresql_where=sa.text("status IN ('RUNNING', 'IN_PROGRESS', 'STARTED')"),
+    )
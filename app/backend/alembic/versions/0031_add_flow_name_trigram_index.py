@@ -0,0 +1,33 @@
+"""Add trigram index for flow name search.
+
+Revision ID: 0031
+Revises: 0030
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0031"
+down_revision = "0030"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add GIN trigram index so ILIKE '%term%' searches on flow names can use an index."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_hedge_fund_flows_name_trgm",
+        "hedge_fund_flows",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    """Remove flow name trigram index."""
+    op.drop_index("ix_hedge_fund_flows_name_trgm", table_name="hedge_fund_flows")
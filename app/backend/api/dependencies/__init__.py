@@ -1,5 +1,27 @@
 """Reusable API dependencies."""
 
-from .database import DBSessionDep, UnitOfWorkDep, initialize_session, initialize_unit_of_work
+from .database import (
+    CacheDep,
+    DBSessionDep,
+    ExchangeClientsDep,
+    UnitOfWorkDep,
+    WorkflowEngineDep,
+    initialize_cache,
+    initialize_exchange_clients,
+    initialize_session,
+    initialize_unit_of_work,
+    initialize_workflow_engine,
+)
 
-__all__ = ["DBSessionDep", "UnitOfWorkDep", "initialize_session", "initialize_unit_of_work"]
+__all__ = [
+    "CacheDep",
+    "DBSessionDep",
+    "ExchangeClientsDep",
+    "UnitOfWorkDep",
+    "WorkflowEngineDep",
+    "initialize_cache",
+    "initialize_exchange_clients",
+    "initialize_session",
+    "initialize_unit_of_work",
+    "initialize_workflow_engine",
+]
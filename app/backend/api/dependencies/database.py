@@ -8,9 +8,13 @@ using SQLAlchemy's AsyncSession.
 from collections.abc import AsyncIterator
 from typing import Annotated
 
+from app.backend.client.exchange_clients import ExchangeClients
+from app.backend.db.cache_manager import CacheManager
 from app.backend.db.session_manager import session_manager
 from app.backend.db.uow import UnitOfWork
-from fastapi import Depends
+from app.backend.src.agents.streaming_agent import WorkflowEngine
+from fastapi import Depends, Request
+from fastapi.requests import HTTPConnection
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -46,8 +50,71 @@ async def initialize_unit_of_work() -> AsyncIterator[UnitOfWork]:
         yield uow
 
 
+async def initialize_cache(request: Request) -> CacheManager:
+    """
+    Provide the application's Redis cache manager.
+
+    Parameters
+    ----------
+        request: Current request, used to reach the application state.
+
+    Returns
+    -------
+        CacheManager: Cache manager created by the application lifespan.
+
+    """
+    return request.app.state.cache_manager
+
+
+async def initialize_exchange_clients(request: Request) -> ExchangeClients:
+    """
+    Provide the application's shared exchange clients.
+
+    Parameters
+    ----------
+        request: Current request, used to reach the application state.
+
+    Returns
+    -------
+        ExchangeClients: Exchange clients using environment credentials, owned by the application lifespan.
+
+    """
+    return request.app.state.exchange_clients
+
+
+async def initialize_workflow_engine(connection: HTTPConnection) -> WorkflowEngine:
+    """
+    Provide the application's streaming workflow engine.
+
+    Parameters
+    ----------
+        connection: Current HTTP request or WebSocket, used to reach the application state.
+
+    Returns
+    -------
+        WorkflowEngine: Workflow engine owned by the application lifespan, so start/stop/status calls
+        all see the same workflow state.
+
+    """
+    return connection.app.state.workflow_engine
+
+
+CacheDep = Annotated[CacheManager, Depends(initialize_cache)]
+ExchangeClientsDep = Annotated[ExchangeClients, Depends(initialize_exchange_clients)]
 DBSessionDep = Annotated[AsyncSession, Depends(initialize_session)]
 UnitOfWorkDep = Annotated[UnitOfWork, Depends(initialize_unit_of_work)]
+WorkflowEngineDep = Annotated[WorkflowEngine, Depends(initialize_workflow_engine)]
 
 
-__all__ = ["DBSessionDep", "UnitOfWorkDep", "initialize_session", "initialize_unit_of_work"]
+__all__ = [
+    "CacheDep",
+    "DBSessionDep",
+    "ExchangeClientsDep",
+    "UnitOfWorkDep",
+    "WorkflowEngineDep",
+    "initialize_cache",
+    "initialize_exchange_clients",
+    "initialize_session",
+    "initialize_unit_of_work",
+    "initialize_workflow_engine",
+]
@@ -1,6 +1,7 @@
 from typing import Any, Literal
 
 from pydantic import BaseModel
+from pydantic_core import to_json
 
 
 class BaseEvent(BaseModel):
@@ -10,8 +11,11 @@ class BaseEvent(BaseModel):
 
     def to_sse(self) -> str:
         """Convert to Server-Sent Event format."""
-        event_type = self.type.lower()
-        return f"event: {event_type}\ndata: {self.model_dump_json()}\n\n"
+        return self.to_sse_bytes().decode()
+
+    def to_sse_bytes(self) -> bytes:
+        """Convert to Server-Sent Event format as bytes, ready to write to the response."""
+        return b"event: " + self.type.lower().encode() + b"\ndata: " + to_json(self) + b"\n\n"
 
 
 class StartEvent(BaseEvent):
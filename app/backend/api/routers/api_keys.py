@@ -9,14 +9,16 @@ from app.backend.api.schemas import (
     ApiKeyUpdateRequest,
     ErrorResponse,
 )
-from app.backend.api.utils.error_handling import handle_repository_errors
 from app.backend.db.models import ApiKey
 from fastapi import APIRouter, HTTPException
+from pydantic import TypeAdapter
 
 router = APIRouter(prefix="/api-keys", tags=["api-keys"])
 
+API_KEY_SUMMARY_LIST_ADAPTER = TypeAdapter(list[ApiKeySummaryResponse])
+API_KEY_LIST_ADAPTER = TypeAdapter(list[ApiKeyResponse])
+
 
-@handle_repository_errors
 @router.post(
     "/",
     response_model=ApiKeyResponse,
@@ -37,7 +39,6 @@ async def create_or_update_api_key(request: ApiKeyCreateRequest, uow: UnitOfWork
     return ApiKeyResponse.model_validate(api_key)
 
 
-@handle_repository_errors
 @router.get(
     "/",
     response_model=list[ApiKeySummaryResponse],
@@ -49,10 +50,9 @@ async def get_api_keys(uow: UnitOfWorkDep, *, include_inactive: bool = False):
     """Get all API keys (without actual key values for security)."""
     repo = uow.get_repository(ApiKey)
     api_keys = await repo.get_all_api_keys(include_inactive=include_inactive)
-    return [ApiKeySummaryResponse.model_validate(key) for key in api_keys]
+    return API_KEY_SUMMARY_LIST_ADAPTER.validate_python(api_keys, from_attributes=True)
 
 
-@handle_repository_errors
 @router.get(
     "/{provider}",
     response_model=ApiKeyResponse,
@@ -70,7 +70,6 @@ async def get_api_key(provider: str, uow: UnitOfWorkDep):
     return ApiKeyResponse.model_validate(api_key)
 
 
-@handle_repository_errors
 @router.put(
     "/{provider}",
     response_model=ApiKeyResponse,
@@ -93,7 +92,6 @@ async def update_api_key(provider: str, request: ApiKeyUpdateRequest, uow: UnitO
     return ApiKeyResponse.model_validate(api_key)
 
 
-@handle_repository_errors
 @router.delete(
     "/{provider}",
     responses={
@@ -111,7 +109,6 @@ async def delete_api_key(provider: str, uow: UnitOfWorkDep):
     return {"message": "API key deleted successfully"}
 
 
-@handle_repository_errors
 @router.patch(
     "/{provider}/deactivate",
     response_model=ApiKeySummaryResponse,
@@ -131,7 +128,6 @@ async def deactivate_api_key(provider: str, uow: UnitOfWorkDep):
     return ApiKeySummaryResponse.model_validate(api_key)
 
 
-@handle_repository_errors
 @router.post(
     "/bulk",
     response_model=list[ApiKeyResponse],
@@ -153,10 +149,9 @@ async def bulk_update_api_keys(request: ApiKeyBulkUpdateRequest, uow: UnitOfWork
         for key in request.api_keys
     ]
     api_keys = await repo.bulk_create_or_update(api_keys_data)
-    return [ApiKeyResponse.model_validate(key) for key in api_keys]
+    return API_KEY_LIST_ADAPTER.validate_python(api_keys, from_attributes=True)
 
 
-@handle_repository_errors
 @router.patch(
     "/{provider}/last-used",
     responses={
@@ -18,7 +18,7 @@ class AsterWebSocketManager:
 
     def __init__(self):
         """Initialize Aster WebSocket manager."""
-        self.active_connections: dict[str, list[WebSocket]] = {}
+        self.active_connections: dict[str, set[WebSocket]] = {}
         self.aster_agents: dict[str, AsterStreamingAnalystAgent] = {}
 
     async def connect(self, websocket: WebSocket, channel: str):
@@ -34,9 +34,7 @@ class AsterWebSocketManager:
         """
         await websocket.accept()
 
-        if channel not in self.active_connections:
-            self.active_connections[channel] = []
-        self.active_connections[channel].append(websocket)
+        self.active_connections.setdefault(channel, set()).add(websocket)
 
         logger.info("Aster WebSocket connected", channel=channel)
 
@@ -51,8 +49,8 @@ class AsterWebSocketManager:
         channel : str
             Channel name
         """
-        if channel in self.active_connections and websocket in self.active_connections[channel]:
-            self.active_connections[channel].remove(websocket)
+        if channel in self.active_connections:
+            self.active_connections[channel].discard(websocket)
 
         logger.info("Aster WebSocket disconnected", channel=channel)
 
@@ -70,7 +68,8 @@ class AsterWebSocketManager:
         if channel in self.active_connections:
             dead_connections = []
 
-            for connection in self.active_connections[channel]:
+            # Iterate a snapshot; connections may come and go while a send is awaited
+            for connection in list(self.active_connections[channel]):
                 try:
                     await connection.send_json(data)
                 except Exception as e:
@@ -78,8 +77,7 @@ class AsterWebSocketManager:
                     dead_connections.append(connection)
 
             # Remove dead connections
-            for connection in dead_connections:
-                self.active_connections[channel].remove(connection)
+            self.active_connections[channel].difference_update(dead_connections)
 
     async def send_to_connection(self, websocket: WebSocket, data: dict):
         """
@@ -1,10 +1,14 @@
 """Council API endpoints for unified Council model (system councils and live trading)."""
 
+import asyncio
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from typing import Annotated
 
+import numpy as np
+import orjson
 import structlog
-from app.backend.api.dependencies import UnitOfWorkDep
+from app.backend.api.dependencies import CacheDep, ExchangeClientsDep, UnitOfWorkDep
 from app.backend.api.schemas import (
     ActivePosition,
     ActivePositionsResponse,
@@ -24,92 +28,240 @@ from app.backend.api.schemas import (
     TradingMetricsResponse,
 )
 from app.backend.api.utils.agent_metadata import create_agent_info, normalize_agent_list
-from app.backend.api.utils.error_handling import handle_repository_errors
 from app.backend.client.aster import AsterClient
 from app.backend.client.binance import BinanceClient
 from app.backend.config.binance import BinanceConfig
+from app.backend.db.cache_manager import CacheManager
 from app.backend.db.models import Council, Wallet
 from app.backend.db.models.futures_position import FuturesPosition
+from app.backend.db.repositories.council_repository import CouncilRepository
 from app.backend.db.repositories.wallet_repository import WalletRepository
-from fastapi import APIRouter, HTTPException, Query
+from app.backend.db.session_manager import session_manager
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
 
 logger = structlog.get_logger(__name__)
 router = APIRouter(prefix="/councils", tags=["councils"])
 
-
-def normalize_position_side(position: FuturesPosition) -> str:
+# Short-lived Redis cache for the public system council endpoints
+SYSTEM_COUNCILS_CACHE_PATTERN = "councils:system:*"
+SYSTEM_COUNCILS_CACHE_KEY = "councils:system:v1"
+SYSTEM_COUNCILS_CACHE_TTL = 30
+SYSTEM_ACTIVITY_CACHE_KEY = "councils:system:activity:v1:limit={limit}"
+SYSTEM_ACTIVITY_CACHE_TTL = 10
+SYSTEM_COUNCILS_INDEX_CACHE_KEY = "councils:system:name_map:v1"
+SYSTEM_COUNCILS_INDEX_CACHE_TTL = 300
+TICKER_CACHE_KEY = "ticker:{venue}:{symbol}"
+TICKER_CACHE_TTL = 3
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+COUNCIL_LIST_ADAPTER = TypeAdapter(list[CouncilResponse])
+# Only the council columns the system listing serializes (skips the per-council metric columns)
+COUNCIL_RESPONSE_COLUMNS = list(CouncilResponse.model_fields)
+DEBATE_MESSAGE_ADAPTER = TypeAdapter(list[DebateMessage])
+TRADE_RECORD_ADAPTER = TypeAdapter(list[TradeRecord])
+CONSENSUS_DECISION_ADAPTER = TypeAdapter(list[ConsensusDecisionResponse])
+AGENT_INFO_ADAPTER = TypeAdapter(AgentInfo)
+AGENT_INFO_LIST_ADAPTER = TypeAdapter(list[AgentInfo])
+
+
+def closed_position_trade_fields(position: FuturesPosition) -> dict:
     """
-    Normalize position side from "BOTH" to "LONG"/"SHORT".
+    Map a closed futures position onto ``TradeRecord`` fields.
 
     Parameters
     ----------
     position : FuturesPosition
-        Position object from database
+        Closed position from database
+
+    Returns
+    -------
+    dict
+        Trade record fields, ready for ``TRADE_RECORD_ADAPTER``
+    """
+    quantity = abs(position.position_amt)  # Always positive
+    return {
+        "id": position.id,
+        "symbol": position.symbol,
+        "order_type": "MARKET",
+        "side": position.normalized_side,  # "BOTH" resolved to "long"/"short"
+        "quantity": quantity,
+        "entry_price": position.entry_price,
+        "exit_price": position.mark_price or None,
+        "pnl": position.realized_pnl or None,
+        "pnl_percentage": (
+            position.realized_pnl / (position.entry_price * quantity) * 100
+            if position.realized_pnl is not None and position.entry_price > 0 and quantity != 0
+            else None
+        ),
+        "status": "closed",
+        "opened_at": position.opened_at,
+        "closed_at": position.closed_at,
+    }
+
+
+async def astream_performance_points(
+    council_id: int,
+    limit: int,
+    since: datetime,
+    *,
+    ndjson: bool,
+) -> AsyncIterator[bytes]:
+    """
+    Serialize performance snapshots row by row straight from the database cursor.
+
+    Runs on its own session because the response body is produced after the
+    request-scoped unit of work has been released.
+
+    Parameters
+    ----------
+    council_id : int
+        Council ID
+    limit : int
+        Maximum number of snapshots
+    since : datetime
+        Oldest snapshot timestamp to include
+    ndjson : bool
+        Emit newline-delimited JSON instead of a JSON array
+
+    Yields
+    ------
+    bytes
+        Encoded response chunks
+    """
+    async with session_manager.session() as session:
+        snapshots = CouncilRepository(session).stream_performance_history(council_id, limit=limit, since=since)
+        if ndjson:
+            async for snapshot in snapshots:
+                yield orjson.dumps(snapshot._asdict(), option=orjson.OPT_UTC_Z) + b"\n"
+            return
+
+        separator = b"["
+        async for snapshot in snapshots:
+            yield separator + orjson.dumps(snapshot._asdict(), option=orjson.OPT_UTC_Z)
+            separator = b","
+        yield b"[]" if separator == b"[" else b"]"
+
+
+async def afetch_system_council_index(
+    repo: CouncilRepository,
+    cache: CacheManager,
+) -> tuple[dict[int, str], list[int]]:
+    """
+    Get system council names and futures council ids, reading through the cache.
+
+    This metadata only changes when councils are created or renamed, so it is
+    cached much longer than the activity payload built from it.
+
+    Parameters
+    ----------
+    repo : CouncilRepository
+        Council repository used on cache miss
+    cache : CacheManager
+        Redis cache manager
 
     Returns
     -------
-    str
-        Normalized position side ("long" or "short" in lowercase for API)
+    tuple[dict[int, str], list[int]]
+        Council name by id, and the ids of futures councils
     """
-    if position.position_side.upper() == "BOTH":
-        # For Binance one-way mode, determine side from position_amt sign
-        return "long" if position.position_amt > 0 else "short"
-    return position.position_side.lower()
+    cached = await cache.aget(SYSTEM_COUNCILS_INDEX_CACHE_KEY)
+    if cached is not None:
+        index = orjson.loads(cached)
+        return {int(council_id): name for council_id, name in index["names"].items()}, index["futures_ids"]
+
+    councils = await repo.get_system_councils(columns=["id", "name", "trading_type"])
+    council_map = {council.id: council.name for council in councils}
+    futures_council_ids = [council.id for council in councils if council.trading_type == "futures"]
+
+    index = {"names": council_map, "futures_ids": futures_council_ids}
+    await cache.aset(
+        SYSTEM_COUNCILS_INDEX_CACHE_KEY,
+        orjson.dumps(index, option=orjson.OPT_NON_STR_KEYS),
+        ttl=SYSTEM_COUNCILS_INDEX_CACHE_TTL,
+    )
+    return council_map, futures_council_ids
+
+
+async def afetch_current_prices(
+    client: BinanceClient | AsterClient,
+    symbols: list[str],
+    cache: CacheManager,
+) -> dict[str, float]:
+    """
+    Fetch current prices for several symbols, reading through the ticker cache.
+
+    All symbols are probed in Redis with a single ``MGET``; on any miss the
+    exchange's bulk price endpoint is called once and the requested symbols
+    are written back with a short TTL, so ticker load is shared across
+    councils and endpoints.
+
+    Parameters
+    ----------
+    client : BinanceClient | AsterClient
+        Exchange client used to query tickers
+    symbols : list[str]
+        Symbols to price (duplicates are fetched once)
+    cache : CacheManager
+        Shared Redis cache
+
+    Returns
+    -------
+    dict[str, float]
+        Mapping of symbol to current price; symbols missing from the cache and
+        the exchange response are omitted
+    """
+    if isinstance(client, BinanceClient):
+        venue = "binance_testnet" if client.config.testnet else "binance"
+    else:
+        venue = "aster"
+
+    unique_symbols = list(dict.fromkeys(symbols))
+    cached = await cache.amget([TICKER_CACHE_KEY.format(venue=venue, symbol=symbol) for symbol in unique_symbols])
+
+    prices = {symbol: float(value) for symbol, value in zip(unique_symbols, cached, strict=True) if value is not None}
+    missing = [symbol for symbol in unique_symbols if symbol not in prices]
+    if not missing:
+        return prices
+
+    try:
+        all_prices = await client.aget_all_tickers()
+    except Exception as e:
+        logger.warning("Failed to fetch tickers", venue=venue, symbols=missing, error=str(e))
+        return prices
+
+    fetched = {symbol: all_prices[symbol] for symbol in missing if symbol in all_prices}
+    await asyncio.gather(
+        *(
+            cache.aset(TICKER_CACHE_KEY.format(venue=venue, symbol=symbol), str(price), ttl=TICKER_CACHE_TTL)
+            for symbol, price in fetched.items()
+        )
+    )
+    prices.update(fetched)
+    return prices
 
 
-@handle_repository_errors
 @router.get("/system", response_model=list[CouncilResponse])
-async def get_system_councils(uow: UnitOfWorkDep):
+async def get_system_councils(uow: UnitOfWorkDep, cache: CacheDep):
     """Get all active system councils."""
+    cached = await cache.aget(SYSTEM_COUNCILS_CACHE_KEY)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     repo = uow.get_repository(Council)
-    councils = await repo.get_system_councils()
-
-    council_fields = {
-        "user_id",
-        "wallet_id",
-        "risk_settings",
-        "win_rate",
-        "forked_from_id",
-        "meta_data",
-        "visual_layout",
-        "agents",
-        "connections",
-        "workflow_config",
-        "is_system",
-        "is_public",
-        "is_template",
-        "name",
-        "description",
-        "strategy",
-        "tags",
-        "initial_capital",
-        "current_capital",
-        "total_pnl",
-        "total_pnl_percentage",
-        "total_trades",
-        "status",
-        "is_active",
-        "created_at",
-        "updated_at",
-        "last_executed_at",
-        "view_count",
-        "fork_count",
-        "id",
-    }
-    patched = []
-    for c in councils:
-        data = CouncilResponse.model_validate(c, from_attributes=True).model_dump(exclude_none=True)
-        for f in council_fields:
-            if f not in data:
-                data[f] = None
-        patched.append(data)
-    return patched
+    councils = await repo.get_system_councils(columns=COUNCIL_RESPONSE_COLUMNS)
+
+    # Validate and serialize the whole list in one pass; unset optional fields default to null
+    body = COUNCIL_LIST_ADAPTER.dump_json(COUNCIL_LIST_ADAPTER.validate_python(councils, from_attributes=True))
+    await cache.aset(SYSTEM_COUNCILS_CACHE_KEY, body, ttl=SYSTEM_COUNCILS_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
 
-@handle_repository_errors
 @router.get("/system/activity", response_model=GlobalActivityResponse)
 async def get_system_councils_activity(
     uow: UnitOfWorkDep,
+    cache: CacheDep,
     limit: Annotated[int, Query(ge=1, le=200)] = 50,
 ):
     """
@@ -117,97 +269,136 @@ async def get_system_councils_activity(
 
     Returns debates and trades from all system councils in a single aggregated response.
     """
+    cache_key = SYSTEM_ACTIVITY_CACHE_KEY.format(limit=limit)
+    cached = await cache.aget(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     repo = uow.get_repository(Council)
 
-    # Get all system councils
-    councils = await repo.get_system_councils()
+    # System council names and futures ids (cached; changes only on council writes)
+    council_map, futures_council_ids = await afetch_system_council_index(repo, cache)
+    council_ids = list(council_map)
 
-    # Create council name mapping
-    council_map = {council.id: council.name for council in councils}
+    # Globally newest debates/trades across all councils, sorted and limited in SQL
+    from app.backend.db.repositories.futures_position_repository import FuturesPositionRepository
 
-    # Fetch debates and trades from all councils in parallel
-    all_debates = []
-    all_trades = []
-
-    for council in councils:
-        try:
-            # Fetch debates for this council
-            debates = await repo.get_recent_debates(council.id, limit=limit)
-
-            # Add council info to debates
-            all_debates.extend(
-                [
-                    DebateMessage(
-                        id=debate.id,
-                        agent_name=debate.agent_name,
-                        message=debate.message,
-                        message_type=debate.message_type,
-                        sentiment=debate.sentiment,
-                        market_symbol=debate.market_symbol,
-                        confidence=float(debate.confidence) if debate.confidence else None,
-                        debate_round=debate.debate_round,
-                        created_at=debate.created_at,
-                        council_id=council.id,
-                        council_name=council.name,
-                    )
-                    for debate in debates
-                ]
-            )
+    debates = await repo.get_recent_debates_global(council_ids, limit=limit)
+    futures_repo = FuturesPositionRepository(uow.session)
+    closed_positions = await futures_repo.find_recent_closed_positions(futures_council_ids, limit=limit)
 
-            # Fetch trades from new tables
-            if council.trading_type == "futures":
-                from app.backend.db.repositories.futures_position_repository import FuturesPositionRepository
+    all_debates = DEBATE_MESSAGE_ADAPTER.validate_python(debates, from_attributes=True)
+    for debate in all_debates:
+        debate.council_name = council_map[debate.council_id]
 
-                futures_repo = FuturesPositionRepository(repo.session)
-                closed_positions = await futures_repo.find_closed_positions(council.id, limit=limit)
+    all_trades = TRADE_RECORD_ADAPTER.validate_python(
+        [
+            {**closed_position_trade_fields(p), "council_id": p.council_id, "council_name": council_map[p.council_id]}
+            for p in closed_positions
+        ]
+    )
 
-                all_trades.extend(
-                    [
-                        TradeRecord(
-                            id=p.id,
-                            symbol=p.symbol,
-                            order_type="MARKET",
-                            side=normalize_position_side(p),  # Normalize "BOTH" → "long"/"short"
-                            quantity=float(abs(p.position_amt)),  # Always positive
-                            entry_price=float(p.entry_price),
-                            exit_price=float(p.mark_price) if p.mark_price else None,
-                            pnl=float(p.realized_pnl) if p.realized_pnl else None,
-                            pnl_percentage=(
-                                float((p.realized_pnl / (p.entry_price * abs(p.position_amt))) * 100)
-                                if p.realized_pnl is not None and p.entry_price > 0 and p.position_amt != 0
-                                else None
-                            ),
-                            status="closed",
-                            opened_at=p.opened_at,
-                            closed_at=p.closed_at,
-                            council_id=council.id,
-                            council_name=council.name,
-                        )
-                        for p in closed_positions
-                    ]
-                )
+    # Children are already validated; the wrapper only needs assembling
+    body = GlobalActivityResponse.model_construct(
+        debates=all_debates,
+        trades=all_trades,
+        councils=council_map,
+    ).model_dump_json()
+    await cache.aset(cache_key, body, ttl=SYSTEM_ACTIVITY_CACHE_TTL)
+    return Response(content=body, media_type="application/json")
 
-        except Exception as e:
-            logger.warning("Error fetching activity for council", council_id=council.id, error=str(e))
-            # Continue with other councils
-            continue
 
-    # Sort by timestamp (most recent first)
-    all_debates.sort(key=lambda d: d.created_at, reverse=True)
-    all_trades.sort(key=lambda t: t.opened_at, reverse=True)
+async def afetch_overview_debates(council_id: int) -> list[DebateMessage]:
+    """
+    Fetch recent debate messages for the council overview on a dedicated session.
 
-    # Limit results
-    all_debates = all_debates[:limit]
-    all_trades = all_trades[:limit]
+    Parameters
+    ----------
+    council_id : int
+        Council ID
+
+    Returns
+    -------
+    list[DebateMessage]
+        Most recent debate messages
+    """
+    async with session_manager.session() as session:
+        debates = await CouncilRepository(session).get_recent_debates(council_id, limit=50)
+        return DEBATE_MESSAGE_ADAPTER.validate_python(debates, from_attributes=True)
 
-    return GlobalActivityResponse(
-        debates=all_debates,
-        trades=all_trades,
-        councils=council_map,
-    )
+
+async def afetch_overview_trades(council_id: int) -> list[TradeRecord]:
+    """
+    Fetch recent closed futures trades for the council overview on a dedicated session.
+
+    Parameters
+    ----------
+    council_id : int
+        Council ID
+
+    Returns
+    -------
+    list[TradeRecord]
+        Most recent closed trades
+    """
+    from app.backend.db.repositories.futures_position_repository import FuturesPositionRepository
+
+    async with session_manager.session() as session:
+        closed_positions = await FuturesPositionRepository(session).find_closed_positions(council_id, limit=20)
+        return TRADE_RECORD_ADAPTER.validate_python([closed_position_trade_fields(p) for p in closed_positions])
+
+
+async def afetch_overview_portfolio(council_id: int) -> dict[str, PortfolioHoldingDetail]:
+    """
+    Fetch active spot holdings for the council overview on a dedicated session.
+
+    Parameters
+    ----------
+    council_id : int
+        Council ID
+
+    Returns
+    -------
+    dict[str, PortfolioHoldingDetail]
+        Holdings keyed by symbol
+    """
+    from app.backend.db.repositories.spot_holding_repository import SpotHoldingRepository
+
+    async with session_manager.session() as session:
+        holdings = await SpotHoldingRepository(session).find_active_holdings(council_id)
+        return {
+            h.symbol: PortfolioHoldingDetail(
+                quantity=float(h.total),
+                avg_cost=float(h.average_cost),
+                total_cost=float(h.total_cost),
+                current_value=float(h.current_value) if h.current_value else None,
+                unrealized_pnl=float(h.unrealized_pnl) if h.unrealized_pnl else None,
+            )
+            for h in holdings
+        }
+
+
+async def afetch_wallet_identity(wallet_id: int) -> tuple[str | None, str | None]:
+    """
+    Fetch wallet contract address and name on a dedicated session.
+
+    Parameters
+    ----------
+    wallet_id : int
+        Wallet ID
+
+    Returns
+    -------
+    tuple[str | None, str | None]
+        Wallet CA and wallet name
+    """
+    async with session_manager.session() as session:
+        wallet_repo = WalletRepository(session)
+        wallet_ca = await wallet_repo.get_wallet_ca_by_id(wallet_id)
+        wallet_name = await wallet_repo.get_wallet_name_by_id(wallet_id)
+        return wallet_ca, wallet_name
 
 
-@handle_repository_errors
 @router.get("/{council_id}/overview", response_model=CouncilOverviewResponse)
 async def get_council_overview(
     uow: UnitOfWorkDep,
@@ -246,86 +437,28 @@ async def get_council_overview(
         if isinstance(agents_data, list):
             agents_list = [create_agent_info(agent_data) for agent_data in agents_data]
 
-    # Optional: Include recent debates
-    debates_list = None
+    # Optional sections are independent reads; run them concurrently, each on its own session
+    tasks = {}
     if include_debates:
-        debates = await repo.get_recent_debates(council_id, limit=50)
-        debates_list = [
-            DebateMessage(
-                id=d.id,
-                agent_name=d.agent_name,
-                message=d.message,
-                message_type=d.message_type,
-                sentiment=d.sentiment,
-                market_symbol=d.market_symbol,
-                confidence=float(d.confidence) if d.confidence else None,
-                debate_round=d.debate_round,
-                created_at=d.created_at,
-            )
-            for d in debates
-        ]
-
-    # Optional: Include recent trades (from new tables)
-    trades_list = None
-    if include_trades:
-        if council.trading_type == "futures":
-            from app.backend.db.repositories.futures_position_repository import FuturesPositionRepository
-
-            futures_repo = FuturesPositionRepository(uow.session)
-            closed_positions = await futures_repo.find_closed_positions(council_id, limit=20)
-            trades_list = [
-                TradeRecord(
-                    id=p.id,
-                    symbol=p.symbol,
-                    order_type="MARKET",
-                    side=normalize_position_side(p),  # Normalize "BOTH" → "long"/"short"
-                    quantity=float(abs(p.position_amt)),  # Always positive
-                    entry_price=float(p.entry_price),
-                    exit_price=float(p.mark_price) if p.mark_price else None,
-                    pnl=float(p.realized_pnl) if p.realized_pnl else None,
-                    pnl_percentage=(
-                        float((p.realized_pnl / (p.entry_price * abs(p.position_amt))) * 100)
-                        if p.realized_pnl is not None and p.entry_price > 0 and p.position_amt != 0
-                        else None
-                    ),
-                    status="closed",
-                    opened_at=p.opened_at,
-                    closed_at=p.closed_at,
-                )
-                for p in closed_positions
-            ]
-        else:  # spot
-            trades_list = []  # Spot holdings don't have "closed" trades
-
-    # Optional: Include portfolio holdings with details (from new tables)
-    portfolio_holdings = None
-    if include_portfolio:
-        if council.trading_type == "spot":
-            from app.backend.db.repositories.spot_holding_repository import SpotHoldingRepository
-
-            spot_repo = SpotHoldingRepository(uow.session)
-            holdings = await spot_repo.find_active_holdings(council_id)
-
-            portfolio_holdings = {}
-            for h in holdings:
-                portfolio_holdings[h.symbol] = PortfolioHoldingDetail(
-                    quantity=float(h.total),
-                    avg_cost=float(h.average_cost),
-                    total_cost=float(h.total_cost),
-                    current_value=float(h.current_value) if h.current_value else None,
-                    unrealized_pnl=float(h.unrealized_pnl) if h.unrealized_pnl else None,
-                )
-
-    # Get wallet CA (Contract Address) and wallet name if wallet exists
-    wallet_ca = None
-    wallet_name = None
+        tasks["debates"] = afetch_overview_debates(council_id)
+    if include_trades and council.trading_type == "futures":
+        tasks["trades"] = afetch_overview_trades(council_id)
+    if include_portfolio and council.trading_type == "spot":
+        tasks["portfolio"] = afetch_overview_portfolio(council_id)
     if council.wallet_id:
-        wallet_repo = WalletRepository(uow.session)
-        wallet_ca = await wallet_repo.get_wallet_ca_by_id(council.wallet_id)
-        wallet_name = await wallet_repo.get_wallet_name_by_id(council.wallet_id)
-
-    # Build response
-    return CouncilOverviewResponse(
+        tasks["wallet"] = afetch_wallet_identity(council.wallet_id)
+    results = dict(zip(tasks, await asyncio.gather(*tasks.values()), strict=True))
+
+    debates_list = results.get("debates")
+    # Spot holdings don't have "closed" trades
+    trades_list = results.get("trades", []) if include_trades else None
+    portfolio_holdings = results.get("portfolio")
+    # Wallet CA (Contract Address) and wallet name if wallet exists
+    wallet_ca, wallet_name = results.get("wallet", (None, None))
+
+    # Every field below is already converted to its schema type and the nested sections are
+    # validated models, so assemble without re-validating and serialize in pydantic-core
+    body = CouncilOverviewResponse.model_construct(
         id=council.id,
         name=council.name,
         description=council.description,
@@ -353,10 +486,10 @@ async def get_council_overview(
         portfolio_holdings=portfolio_holdings,
         wallet_ca=wallet_ca,
         wallet_name=wallet_name,
-    )
+    ).model_dump_json()
+    return Response(content=body, media_type="application/json")
 
 
-@handle_repository_errors
 @router.get("/{council_id}/debates", response_model=list[DebateMessage])
 async def get_council_debates(
     uow: UnitOfWorkDep,
@@ -367,23 +500,11 @@ async def get_council_debates(
     repo = uow.get_repository(Council)
     debates = await repo.get_recent_debates(council_id, limit=limit)
 
-    return [
-        DebateMessage(
-            id=d.id,
-            agent_name=d.agent_name,
-            message=d.message,
-            message_type=d.message_type,
-            sentiment=d.sentiment,
-            market_symbol=d.market_symbol,
-            confidence=float(d.confidence) if d.confidence else None,
-            debate_round=d.debate_round,
-            created_at=d.created_at,
-        )
-        for d in debates
-    ]
+    # Validate once from the ORM rows and serialize in pydantic-core, bypassing response_model re-encoding
+    body = DEBATE_MESSAGE_ADAPTER.dump_json(DEBATE_MESSAGE_ADAPTER.validate_python(debates, from_attributes=True))
+    return Response(content=body, media_type="application/json")
 
 
-@handle_repository_errors
 @router.get("/{council_id}/trades", response_model=list[TradeRecord])
 async def get_council_trades(
     uow: UnitOfWorkDep,
@@ -551,65 +672,36 @@ async def get_council_trades(
         futures_repo = FuturesPositionRepository(uow.session)
         closed_positions = await futures_repo.find_closed_positions(council_id, limit=limit)
 
-        return [
-            TradeRecord(
-                id=p.id,
-                symbol=p.symbol,
-                order_type="MARKET",
-                side=normalize_position_side(p),  # Normalize "BOTH" → "long"/"short"
-                quantity=float(abs(p.position_amt)),  # Always positive
-                entry_price=float(p.entry_price),
-                exit_price=float(p.mark_price) if p.mark_price else None,
-                pnl=float(p.realized_pnl) if p.realized_pnl else None,
-                pnl_percentage=(
-                    float((p.realized_pnl / (p.entry_price * abs(p.position_amt))) * 100)
-                    if p.realized_pnl is not None and p.entry_price > 0 and p.position_amt != 0
-                    else None
-                ),
-                status="closed",
-                opened_at=p.opened_at,
-                closed_at=p.closed_at,
-            )
-            for p in closed_positions
-        ]
+        trades = TRADE_RECORD_ADAPTER.validate_python([closed_position_trade_fields(p) for p in closed_positions])
+        return Response(content=TRADE_RECORD_ADAPTER.dump_json(trades), media_type="application/json")
     return []
 
 
-@handle_repository_errors
 @router.get("/{council_id}/performance", response_model=list[PerformanceDataPoint])
 async def get_council_performance(
-    uow: UnitOfWorkDep,
+    request: Request,
     *,
     council_id: int,
     days: Annotated[int, Query(ge=1, le=365)] = 30,
     limit: Annotated[int | None, Query(ge=1, le=100000)] = None,
 ):
-    """Get historical performance data for a council."""
+    """
+    Get historical performance data for a council.
+
+    Rows are streamed from the database as they arrive: a JSON array by default,
+    or newline-delimited JSON when the client sends ``Accept: application/x-ndjson``.
+    """
     # Backward compatibility: allow legacy `limit` query param
     effective_limit = limit if limit is not None else days * 24
-
-    repo = uow.get_repository(Council)
-    performance_data = await repo.get_performance_history(council_id, limit=effective_limit)
-
-    # Filter to requested date range
     cutoff_date = datetime.now(UTC) - timedelta(days=days)
-    filtered_data = [p for p in performance_data if p.timestamp >= cutoff_date]
-
-    return [
-        PerformanceDataPoint(
-            timestamp=p.timestamp,
-            total_value=float(p.total_value),
-            pnl=float(p.pnl),
-            pnl_percentage=float(p.pnl_percentage),
-            win_rate=float(p.win_rate) if p.win_rate else None,
-            total_trades=p.total_trades or 0,
-            open_positions=p.open_positions or 0,
-        )
-        for p in filtered_data
-    ]
+    ndjson = NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+    return StreamingResponse(
+        astream_performance_points(council_id, limit=effective_limit, since=cutoff_date, ndjson=ndjson),
+        media_type=NDJSON_MEDIA_TYPE if ndjson else "application/json",
+    )
 
 
-@handle_repository_errors
 @router.get("/system/total-account-value", response_model=TotalAccountValueResponse)
 async def get_total_account_value(
     uow: UnitOfWorkDep,
@@ -706,64 +798,65 @@ async def get_total_account_value(
     )
 
 
-@handle_repository_errors
 @router.get("/{council_id}/agents", response_model=list[AgentInfo])
 async def get_council_agents(council_id: int, uow: UnitOfWorkDep):
     """Get all agents for a council."""
     repo = uow.get_repository(Council)
-    council = await repo.get_council_by_id(council_id)
+    agents = await repo.get_council_agents_config(council_id)
 
-    if not council:
+    if agents is None:
         raise HTTPException(status_code=404, detail="Council not found")
 
-    # Parse agents from JSON
-    if isinstance(council.agents, list):
-        return [
-            AgentInfo(
-                id=agent_data.get("id", ""),
-                name=agent_data.get("name", ""),
-                type=agent_data.get("type", ""),
-                role=agent_data.get("role"),
-                traits=agent_data.get("traits"),
-                specialty=agent_data.get("specialty"),
-                system_prompt=agent_data.get("system_prompt"),
-                position=agent_data.get("position"),
-            )
-            for agent_data in council.agents
-        ]
+    # Parse agents from JSON, validating and serializing the whole list in pydantic-core
+    if isinstance(agents, list):
+        agent_infos = AGENT_INFO_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "id": agent_data.get("id", ""),
+                    "name": agent_data.get("name", ""),
+                    "type": agent_data.get("type", ""),
+                    "role": agent_data.get("role"),
+                    "traits": agent_data.get("traits"),
+                    "specialty": agent_data.get("specialty"),
+                    "system_prompt": agent_data.get("system_prompt"),
+                    "position": agent_data.get("position"),
+                }
+                for agent_data in agents
+            ]
+        )
+        return Response(content=AGENT_INFO_LIST_ADAPTER.dump_json(agent_infos), media_type="application/json")
 
     return []
 
 
-@handle_repository_errors
 @router.get("/{council_id}/agents/{agent_id}", response_model=AgentInfo)
 async def get_council_agent(council_id: int, agent_id: str, uow: UnitOfWorkDep):
     """Get specific agent details from a council."""
     repo = uow.get_repository(Council)
-    council = await repo.get_council_by_id(council_id)
 
-    if not council:
-        raise HTTPException(status_code=404, detail="Council not found")
+    # Match the agent inside the database instead of scanning the JSON array here
+    agent_data = await repo.get_council_agent_config(council_id, agent_id)
+    if agent_data is not None:
+        # AgentInfo is a plain dataclass that FastAPI would pass through unchecked; validate the raw JSON
+        return AGENT_INFO_ADAPTER.validate_python(
+            {
+                "id": agent_data.get("id", ""),
+                "name": agent_data.get("name", ""),
+                "type": agent_data.get("type", ""),
+                "role": agent_data.get("role"),
+                "traits": agent_data.get("traits"),
+                "specialty": agent_data.get("specialty"),
+                "system_prompt": agent_data.get("system_prompt"),
+                "position": agent_data.get("position"),
+            }
+        )
 
-    # Find agent in JSON
-    if isinstance(council.agents, list):
-        for agent_data in council.agents:
-            if agent_data.get("id") == agent_id:
-                return AgentInfo(
-                    id=agent_data.get("id", ""),
-                    name=agent_data.get("name", ""),
-                    type=agent_data.get("type", ""),
-                    role=agent_data.get("role"),
-                    traits=agent_data.get("traits"),
-                    specialty=agent_data.get("specialty"),
-                    system_prompt=agent_data.get("system_prompt"),
-                    position=agent_data.get("position"),
-                )
+    if await repo.get_council_agents_config(council_id) is None:
+        raise HTTPException(status_code=404, detail="Council not found")
 
     raise HTTPException(status_code=404, detail="Agent not found in council")
 
 
-@handle_repository_errors
 @router.get("/{council_id}/consensus", response_model=list[ConsensusDecisionResponse])
 async def get_council_consensus_decisions(
     council_id: int,
@@ -786,31 +879,13 @@ async def get_council_consensus_decisions(
         limit=limit,
     )
 
-    # Convert to response models
-    return [
-        ConsensusDecisionResponse(
-            id=decision.id,
-            council_id=decision.council_id,
-            decision=decision.decision,
-            symbol=decision.symbol,
-            confidence=float(decision.confidence) if decision.confidence else None,
-            votes_buy=decision.votes_buy,
-            votes_sell=decision.votes_sell,
-            votes_hold=decision.votes_hold,
-            total_votes=decision.total_votes,
-            agent_votes=decision.agent_votes,
-            reasoning=decision.reasoning,
-            market_price=float(decision.market_price) if decision.market_price else None,
-            was_executed=decision.was_executed,
-            market_order_id=decision.market_order_id,
-            execution_reason=decision.execution_reason,
-            created_at=decision.created_at,
-        )
-        for decision in decisions
-    ]
+    # Validate once from the ORM rows and serialize in pydantic-core, bypassing response_model re-encoding
+    body = CONSENSUS_DECISION_ADAPTER.dump_json(
+        CONSENSUS_DECISION_ADAPTER.validate_python(decisions, from_attributes=True)
+    )
+    return Response(content=body, media_type="application/json")
 
 
-@handle_repository_errors
 @router.get("/{council_id}/metrics", response_model=TradingMetricsResponse)
 async def get_council_trading_metrics(council_id: int, uow: UnitOfWorkDep):
     """
@@ -841,9 +916,10 @@ async def get_council_trading_metrics(council_id: int, uow: UnitOfWorkDep):
     )
 
 
-@handle_repository_errors
 @router.get("/{council_id}/active-positions", response_model=ActivePositionsResponse)
-async def get_council_active_positions(council_id: int, uow: UnitOfWorkDep):
+async def get_council_active_positions(
+    council_id: int, uow: UnitOfWorkDep, cache: CacheDep, exchanges: ExchangeClientsDep
+):
     """
     Get all active trading positions for a council from wallet API.
 
@@ -970,11 +1046,9 @@ async def get_council_active_positions(council_id: int, uow: UnitOfWorkDep):
                             "Failed to use wallet credentials for fallback, using environment variables",
                             error=str(e),
                         )
-                        config = BinanceConfig(testnet=True)
-                        client = BinanceClient(config)
+                        client = exchanges.binance_testnet
                 else:
-                    config = BinanceConfig(testnet=True)
-                    client = BinanceClient(config)
+                    client = exchanges.binance_testnet
             else:
                 # Real trading - try wallet first
                 if wallet and wallet.exchange.lower() == "aster":
@@ -985,52 +1059,55 @@ async def get_council_active_positions(council_id: int, uow: UnitOfWorkDep):
                             "Failed to use wallet credentials for fallback, using environment variables",
                             error=str(e),
                         )
-                        client = AsterClient()
+                        client = exchanges.aster
                 else:
-                    client = AsterClient()
+                    client = exchanges.aster
 
-        for p in positions:
-            try:
-                # Fetch current price
-                ticker = await client.aget_ticker(p.symbol)
-                current_price = float(ticker.price)
+        # Fetch current prices for all symbols (cached, one bulk exchange call on miss)
+        prices = await afetch_current_prices(client, [p.symbol for p in positions], cache)
 
-                # Calculate unrealized PnL based on current price
-                entry_price = float(p.entry_price)
-                position_amt = float(p.position_amt)
-                unrealized_pnl = (current_price - entry_price) * position_amt
-
-                # Calculate percentage based on notional value (with leverage)
-                cost_basis = abs(entry_price * position_amt)
-                unrealized_pnl_pct = (unrealized_pnl / cost_basis * 100) if cost_basis > 0 else 0.0
-
-                active_positions.append(
-                    ActivePosition(
-                        id=p.id,
-                        symbol=p.symbol,
-                        side=normalize_position_side(p),  # Normalize "BOTH" → "long"/"short"
-                        entry_price=entry_price,
-                        current_price=current_price,
-                        quantity=float(abs(position_amt)),  # Always positive
-                        leverage=p.leverage,
-                        unrealized_pnl=unrealized_pnl,
-                        unrealized_pnl_percentage=unrealized_pnl_pct,
-                        opened_at=p.opened_at,
-                        liquidation_price=float(p.liquidation_price) if p.liquidation_price else None,
-                        margin_used=float(p.isolated_margin) if p.isolated_margin else None,
-                        notional=float(p.notional) if p.notional else None,
-                    )
-                )
-                total_unrealized += unrealized_pnl
-
-            except Exception as e:
+        priced_positions = []
+        for p in positions:
+            if p.symbol in prices:
+                priced_positions.append(p)
+            else:
                 logger.warning(
                     "Failed to fetch current price for futures position",
                     symbol=p.symbol,
                     position_id=p.id,
-                    error=str(e),
                 )
 
+        # Unrealized PnL for all positions at once; percentage is against notional cost basis (with leverage)
+        count = len(priced_positions)
+        entry_prices = np.fromiter((p.entry_price for p in priced_positions), dtype=np.float64, count=count)
+        position_amts = np.fromiter((p.position_amt for p in priced_positions), dtype=np.float64, count=count)
+        current_prices = np.fromiter((prices[p.symbol] for p in priced_positions), dtype=np.float64, count=count)
+        unrealized_pnls = (current_prices - entry_prices) * position_amts
+        cost_bases = np.abs(entry_prices * position_amts)
+        unrealized_pnl_pcts = np.divide(
+            unrealized_pnls * 100, cost_bases, out=np.zeros_like(unrealized_pnls), where=cost_bases > 0
+        )
+
+        for i, p in enumerate(priced_positions):
+            active_positions.append(
+                ActivePosition(
+                    id=p.id,
+                    symbol=p.symbol,
+                    side=p.normalized_side,  # "BOTH" resolved to "long"/"short"
+                    entry_price=entry_prices[i],
+                    current_price=current_prices[i],
+                    quantity=abs(position_amts[i]),  # Always positive
+                    leverage=p.leverage,
+                    unrealized_pnl=unrealized_pnls[i],
+                    unrealized_pnl_percentage=unrealized_pnl_pcts[i],
+                    opened_at=p.opened_at,
+                    liquidation_price=float(p.liquidation_price) if p.liquidation_price else None,
+                    margin_used=float(p.isolated_margin) if p.isolated_margin else None,
+                    notional=float(p.notional) if p.notional else None,
+                )
+            )
+        total_unrealized += float(unrealized_pnls.sum())
+
     else:  # spot
         # Get spot holdings from new table (direct instantiation)
         from app.backend.db.repositories.spot_holding_repository import SpotHoldingRepository
@@ -1041,16 +1118,16 @@ async def get_council_active_positions(council_id: int, uow: UnitOfWorkDep):
         # Initialize appropriate client
         if not client:
             if council.trading_mode == "paper":
-                config = BinanceConfig(testnet=True)
-                client = BinanceClient(config)
+                client = exchanges.binance_testnet
             else:
-                client = AsterClient()
+                client = exchanges.aster
+
+        # Fetch current prices for all symbols (cached, one bulk exchange call on miss)
+        prices = await afetch_current_prices(client, [h.symbol for h in holdings], cache)
 
         for h in holdings:
             try:
-                # Fetch current price
-                ticker = await client.aget_ticker(h.symbol)
-                current_price = float(ticker.price)
+                current_price = prices[h.symbol]
 
                 # Calculate unrealized PnL
                 current_value = float(h.total) * current_price
@@ -1088,9 +1165,8 @@ async def get_council_active_positions(council_id: int, uow: UnitOfWorkDep):
     )
 
 
-@handle_repository_errors
 @router.post("/", response_model=CouncilResponse)
-async def create_council(request: CouncilCreateRequest, uow: UnitOfWorkDep):
+async def create_council(request: CouncilCreateRequest, uow: UnitOfWorkDep, cache: CacheDep):
     """
     Create a new council.
     
@@ -1136,5 +1212,8 @@ async def create_council(request: CouncilCreateRequest, uow: UnitOfWorkDep):
     
     # Reload council to get wallet_id if wallet was created
     council = await council_repo.get_council_by_id(council.id)
+
+    # Drop cached system council listings so they reflect the new council
+    await cache.adelete_pattern(SYSTEM_COUNCILS_CACHE_PATTERN)
     
     return CouncilResponse.model_validate(council, from_attributes=True)
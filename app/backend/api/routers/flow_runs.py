@@ -10,15 +10,40 @@ from app.backend.api.schemas import (
     FlowRunSummaryResponse,
     FlowRunUpdateRequest,
 )
-from app.backend.api.utils.error_handling import handle_repository_errors
-from app.backend.api.utils.validators import verify_flow_exists
+from app.backend.api.utils.validators import get_flow_run_or_404, verify_flow_exists
 from app.backend.db.models import HedgeFundFlowRun
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import TypeAdapter
 
 router = APIRouter(prefix="/flows/{flow_id}/runs", tags=["flow-runs"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+FLOW_RUN_SUMMARY_LIST_ADAPTER = TypeAdapter(list[FlowRunSummaryResponse])
+# Only the run columns the summary listing serializes (skips request_data/results)
+FLOW_RUN_SUMMARY_COLUMNS = list(FlowRunSummaryResponse.model_fields)
+
+
+def flow_run_json_response(flow_run: HedgeFundFlowRun | None) -> Response:
+    """
+    Serialize a flow run straight to a JSON response.
+
+    The ORM row is validated once here; returning raw bytes skips FastAPI's
+    second validation pass against ``response_model``.
+
+    Parameters
+    ----------
+    flow_run : HedgeFundFlowRun | None
+        Flow run to serialize, or None to return ``null``.
+
+    Returns
+    -------
+    Response
+        JSON response with the serialized run.
+    """
+    content = FlowRunResponse.model_validate(flow_run).model_dump_json() if flow_run else b"null"
+    return Response(content=content, media_type="application/json")
+
 
-@handle_repository_errors
 @router.post(
     "/",
     response_model=FlowRunResponse,
@@ -36,7 +61,6 @@ async def create_flow_run(flow_id: int, request: FlowRunCreateRequest, uow: Unit
     return FlowRunResponse.model_validate(flow_run)
 
 
-@handle_repository_errors
 @router.get(
     "/",
     response_model=list[FlowRunSummaryResponse],
@@ -49,19 +73,31 @@ async def get_flow_runs(
     flow_id: int,
     uow: UnitOfWorkDep,
     limit: Annotated[int, Query(ge=1, le=100, description="Maximum number of runs to return")] = 50,
-    offset: Annotated[int, Query(ge=0, description="Number of runs to skip")] = 0,
+    cursor: Annotated[
+        int | None, Query(ge=1, description="Return runs older than this run ID (value of X-Next-Cursor)")
+    ] = None,
+    offset: Annotated[int, Query(ge=0, deprecated=True, description="Number of runs to skip; use cursor")] = 0,
 ):
-    """Get all runs for the specified flow."""
+    """
+    Get runs for the specified flow, newest first.
+
+    Pages are keyset-paginated: when more runs may follow, the ``X-Next-Cursor``
+    header carries the ``cursor`` value for the next page.
+    """
     await verify_flow_exists(uow, flow_id)
 
     run_repo = uow.get_repository(HedgeFundFlowRun)
-    flow_runs = await run_repo.get_runs_by_flow_id(flow_id)
-    # Apply pagination
-    paginated_runs = flow_runs[offset : offset + limit] if limit else flow_runs[offset:]
-    return [FlowRunSummaryResponse.model_validate(run) for run in paginated_runs]
+    flow_runs = await run_repo.get_run_summaries_by_flow_id(
+        flow_id, FLOW_RUN_SUMMARY_COLUMNS, limit=limit, offset=offset, before_id=cursor
+    )
+    summaries = FLOW_RUN_SUMMARY_LIST_ADAPTER.validate_python(flow_runs)
+    response = Response(content=FLOW_RUN_SUMMARY_LIST_ADAPTER.dump_json(summaries), media_type="application/json")
+    if len(flow_runs) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(flow_runs[-1]["id"])
+
+    return response
 
 
-@handle_repository_errors
 @router.get(
     "/active",
     response_model=FlowRunResponse | None,
@@ -75,13 +111,10 @@ async def get_active_flow_run(flow_id: int, uow: UnitOfWorkDep):
     await verify_flow_exists(uow, flow_id)
 
     run_repo = uow.get_repository(HedgeFundFlowRun)
-    active_runs = await run_repo.get_active_runs()
-    # Filter for this specific flow
-    active_run = next((run for run in active_runs if run.flow_id == flow_id), None)
-    return FlowRunResponse.model_validate(active_run) if active_run else None
+    active_run = await run_repo.get_active_run_for_flow(flow_id)
+    return flow_run_json_response(active_run)
 
 
-@handle_repository_errors
 @router.get(
     "/latest",
     response_model=FlowRunResponse | None,
@@ -96,10 +129,9 @@ async def get_latest_flow_run(flow_id: int, uow: UnitOfWorkDep):
 
     run_repo = uow.get_repository(HedgeFundFlowRun)
     latest_run = await run_repo.get_latest_run_for_flow(flow_id)
-    return FlowRunResponse.model_validate(latest_run) if latest_run else None
+    return flow_run_json_response(latest_run)
 
 
-@handle_repository_errors
 @router.get(
     "/{run_id}",
     response_model=FlowRunResponse,
@@ -110,17 +142,10 @@ async def get_latest_flow_run(flow_id: int, uow: UnitOfWorkDep):
 )
 async def get_flow_run(flow_id: int, run_id: int, uow: UnitOfWorkDep):
     """Get a specific flow run by ID."""
-    await verify_flow_exists(uow, flow_id)
+    flow_run = await get_flow_run_or_404(uow, flow_id, run_id)
+    return flow_run_json_response(flow_run)
 
-    run_repo = uow.get_repository(HedgeFundFlowRun)
-    flow_run = await run_repo.get_by_id(run_id)
-    if not flow_run or flow_run.flow_id != flow_id:
-        raise HTTPException(status_code=404, detail="Flow run not found")
-
-    return FlowRunResponse.model_validate(flow_run)
 
-
-@handle_repository_errors
 @router.put(
     "/{run_id}",
     response_model=FlowRunResponse,
@@ -131,14 +156,9 @@ async def get_flow_run(flow_id: int, run_id: int, uow: UnitOfWorkDep):
 )
 async def update_flow_run(flow_id: int, run_id: int, request: FlowRunUpdateRequest, uow: UnitOfWorkDep):
     """Update an existing flow run."""
-    await verify_flow_exists(uow, flow_id)
+    await get_flow_run_or_404(uow, flow_id, run_id)
 
     run_repo = uow.get_repository(HedgeFundFlowRun)
-    # Verify the run exists and belongs to this flow
-    existing_run = await run_repo.get_by_id(run_id)
-    if not existing_run or existing_run.flow_id != flow_id:
-        raise HTTPException(status_code=404, detail="Flow run not found")
-
     flow_run = await run_repo.update(
         id=run_id, status=request.status, results=request.results, error_message=request.error_message
     )
@@ -149,7 +169,6 @@ async def update_flow_run(flow_id: int, run_id: int, request: FlowRunUpdateReque
     return FlowRunResponse.model_validate(flow_run)
 
 
-@handle_repository_errors
 @router.delete(
     "/{run_id}",
     responses={
@@ -160,14 +179,9 @@ async def update_flow_run(flow_id: int, run_id: int, request: FlowRunUpdateReque
 )
 async def delete_flow_run(flow_id: int, run_id: int, uow: UnitOfWorkDep):
     """Delete a flow run."""
-    await verify_flow_exists(uow, flow_id)
+    await get_flow_run_or_404(uow, flow_id, run_id)
 
     run_repo = uow.get_repository(HedgeFundFlowRun)
-    # Verify run exists and belongs to this flow
-    existing_run = await run_repo.get_by_id(run_id)
-    if not existing_run or existing_run.flow_id != flow_id:
-        raise HTTPException(status_code=404, detail="Flow run not found")
-
     success = await run_repo.delete(run_id)
     if not success:
         raise HTTPException(status_code=404, detail="Flow run not found")
@@ -175,7 +189,6 @@ async def delete_flow_run(flow_id: int, run_id: int, uow: UnitOfWorkDep):
     return {"message": "Flow run deleted successfully"}
 
 
-@handle_repository_errors
 @router.delete(
     "/",
     responses={
@@ -189,16 +202,11 @@ async def delete_all_flow_runs(flow_id: int, uow: UnitOfWorkDep):
     await verify_flow_exists(uow, flow_id)
 
     run_repo = uow.get_repository(HedgeFundFlowRun)
-    flow_runs = await run_repo.get_runs_by_flow_id(flow_id)
-    deleted_count = 0
-    for run in flow_runs:
-        if await run_repo.delete(run.id):
-            deleted_count += 1
+    deleted_count = await run_repo.delete_by_flow_id(flow_id)
 
     return {"message": f"Deleted {deleted_count} flow runs successfully"}
 
 
-@handle_repository_errors
 @router.get(
     "/count",
     responses={
@@ -212,5 +220,5 @@ async def get_flow_run_count(flow_id: int, uow: UnitOfWorkDep):
     await verify_flow_exists(uow, flow_id)
 
     run_repo = uow.get_repository(HedgeFundFlowRun)
-    flow_runs = await run_repo.get_runs_by_flow_id(flow_id)
-    return {"flow_id": flow_id, "total_runs": len(flow_runs)}
+    total_runs = await run_repo.count_runs_by_flow_id(flow_id)
+    return {"flow_id": flow_id, "total_runs": total_runs}
@@ -10,14 +10,17 @@ from app.backend.api.schemas import (
     FlowSummaryResponse,
     FlowUpdateRequest,
 )
-from app.backend.api.utils.error_handling import handle_repository_errors
 from app.backend.db.models import HedgeFundFlow
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import TypeAdapter
 
 router = APIRouter(prefix="/flows", tags=["flows"])
 
+FLOW_SUMMARY_LIST_ADAPTER = TypeAdapter(list[FlowSummaryResponse])
+# Only the flow columns the summary listing serializes (skips nodes/edges/viewport/data)
+FLOW_SUMMARY_COLUMNS = list(FlowSummaryResponse.model_fields)
+
 
-@handle_repository_errors
 @router.post(
     "/",
     response_model=FlowResponse,
@@ -42,7 +45,6 @@ async def create_flow(request: FlowCreateRequest, uow: UnitOfWorkDep):
     return FlowResponse.model_validate(flow)
 
 
-@handle_repository_errors
 @router.get(
     "/",
     response_model=list[FlowSummaryResponse],
@@ -57,11 +59,11 @@ async def get_flows(
 ):
     """Get all flows (summary view)."""
     repo = uow.get_repository(HedgeFundFlow)
-    flows = await repo.get_all_flows(include_templates=include_templates)
-    return [FlowSummaryResponse.model_validate(flow) for flow in flows]
+    flows = await repo.get_flow_summaries(FLOW_SUMMARY_COLUMNS, include_templates=include_templates)
+    summaries = FLOW_SUMMARY_LIST_ADAPTER.validate_python(flows)
+    return Response(content=FLOW_SUMMARY_LIST_ADAPTER.dump_json(summaries), media_type="application/json")
 
 
-@handle_repository_errors
 @router.get(
     "/{flow_id}",
     response_model=FlowResponse,
@@ -76,10 +78,10 @@ async def get_flow(flow_id: int, uow: UnitOfWorkDep):
     flow = await repo.get_flow_by_id(flow_id)
     if not flow:
         raise HTTPException(status_code=404, detail="Flow not found")
-    return FlowResponse.model_validate(flow)
+    # Validated once from the ORM row; returning bytes skips FastAPI's second response_model pass
+    return Response(content=FlowResponse.model_validate(flow).model_dump_json(), media_type="application/json")
 
 
-@handle_repository_errors
 @router.put(
     "/{flow_id}",
     response_model=FlowResponse,
@@ -107,7 +109,6 @@ async def update_flow(flow_id: int, request: FlowUpdateRequest, uow: UnitOfWorkD
     return FlowResponse.model_validate(flow)
 
 
-@handle_repository_errors
 @router.delete(
     "/{flow_id}",
     responses={
@@ -125,7 +126,6 @@ async def delete_flow(flow_id: int, uow: UnitOfWorkDep):
     return {"message": "Flow deleted successfully"}
 
 
-@handle_repository_errors
 @router.post(
     "/{flow_id}/duplicate",
     response_model=FlowResponse,
@@ -143,7 +143,6 @@ async def duplicate_flow(flow_id: int, uow: UnitOfWorkDep, new_name: str | None
     return FlowResponse.model_validate(flow)
 
 
-@handle_repository_errors
 @router.get(
     "/search/{name}",
     response_model=list[FlowSummaryResponse],
@@ -151,8 +150,13 @@ async def duplicate_flow(flow_id: int, uow: UnitOfWorkDep, new_name: str | None
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-async def search_flows(name: str, uow: UnitOfWorkDep):
+async def search_flows(
+    name: str,
+    uow: UnitOfWorkDep,
+    limit: Annotated[int, Query(ge=1, le=100, description="Maximum number of flows to return")] = 100,
+):
     """Search flows by name."""
     repo = uow.get_repository(HedgeFundFlow)
-    flows = await repo.get_flows_by_name(name)
-    return [FlowSummaryResponse.model_validate(flow) for flow in flows]
+    flows = await repo.get_flows_by_name(name, limit=limit)
+    summaries = FLOW_SUMMARY_LIST_ADAPTER.validate_python(flows, from_attributes=True)
+    return Response(content=FLOW_SUMMARY_LIST_ADAPTER.dump_json(summaries), media_type="application/json")
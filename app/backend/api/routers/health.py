@@ -1,8 +1,8 @@
 """Health check and system status endpoints."""
 
 import asyncio
-import json
 
+import orjson
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 
@@ -23,7 +23,7 @@ async def ping():
         """Generate SSE ping events."""
         for i in range(5):
             data = {"ping": f"ping {i + 1}/5", "timestamp": i + 1}
-            yield f"data: {json.dumps(data)}\n\n"
+            yield f"data: {orjson.dumps(data).decode()}\n\n"
             await asyncio.sleep(1)
 
     return StreamingResponse(event_generator(), media_type="text/event-stream")
@@ -1,11 +1,12 @@
 import asyncio
 import contextlib
+from collections.abc import AsyncIterator
 
+import orjson
 import structlog
 from app.backend.api.dependencies import UnitOfWorkDep
 from app.backend.api.events import CompleteEvent, ErrorEvent, ProgressUpdateEvent, StartEvent
 from app.backend.api.schemas import (
-    BacktestDayResult,
     BacktestPerformanceMetrics,
     BacktestRequest,
     ErrorResponse,
@@ -24,6 +25,100 @@ logger = structlog.get_logger(__name__)
 
 router = APIRouter(prefix="/hedge-fund")
 
+# Cap on buffered progress events per stream so a slow client can't grow memory without bound
+PROGRESS_QUEUE_MAXSIZE = 1024
+# Upper bounds on how many queued events are coalesced into a single SSE write
+PROGRESS_BATCH_MAX_EVENTS = 64
+PROGRESS_BATCH_MAX_BYTES = 64 * 1024
+
+
+def put_progress_event(queue: asyncio.Queue, event: ProgressUpdateEvent) -> None:
+    """
+    Enqueue a progress event, dropping the oldest buffered event when the queue is full.
+
+    Parameters
+    ----------
+    queue : asyncio.Queue
+        Bounded per-stream progress queue.
+    event : ProgressUpdateEvent
+        Event to enqueue.
+    """
+    if queue.full():
+        with contextlib.suppress(asyncio.QueueEmpty):
+            queue.get_nowait()
+    queue.put_nowait(event)
+
+
+def drain_progress_batch(first_event: ProgressUpdateEvent, queue: asyncio.Queue) -> bytes:
+    """
+    Concatenate an event with whatever is already queued into one SSE chunk.
+
+    Parameters
+    ----------
+    first_event : ProgressUpdateEvent
+        Event already taken from the queue.
+    queue : asyncio.Queue
+        Progress queue to drain without blocking.
+
+    Returns
+    -------
+    bytes
+        SSE frames for up to ``PROGRESS_BATCH_MAX_EVENTS`` events or roughly
+        ``PROGRESS_BATCH_MAX_BYTES`` bytes.
+    """
+    chunks = [first_event.to_sse_bytes()]
+    size = len(chunks[0])
+    while len(chunks) < PROGRESS_BATCH_MAX_EVENTS and size < PROGRESS_BATCH_MAX_BYTES:
+        try:
+            chunk = queue.get_nowait().to_sse_bytes()
+        except asyncio.QueueEmpty:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks)
+
+
+async def astream_progress_events(
+    queue: asyncio.Queue, work_task: asyncio.Task, disconnect_task: asyncio.Task
+) -> AsyncIterator[bytes]:
+    """
+    Stream batched progress events until the work finishes or the client disconnects.
+
+    Waits on the queue, the work task and the disconnect task together, so events
+    are forwarded as soon as they arrive and completion is noticed immediately
+    rather than on a polling interval.
+
+    Parameters
+    ----------
+    queue : asyncio.Queue
+        Progress queue fed by the progress handlers.
+    work_task : asyncio.Task
+        Task running the hedge fund or backtest.
+    disconnect_task : asyncio.Task
+        Task that completes when the client disconnects.
+
+    Yields
+    ------
+    bytes
+        SSE chunks containing one or more progress events.
+    """
+    get_task = asyncio.create_task(queue.get())
+    try:
+        while True:
+            done, _ = await asyncio.wait({get_task, work_task, disconnect_task}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnect_task in done:
+                return
+            if get_task in done:
+                yield drain_progress_batch(get_task.result(), queue)
+                get_task = asyncio.create_task(queue.get())
+            if work_task in done:
+                # Flush anything the work emitted right before finishing
+                while not queue.empty():
+                    yield drain_progress_batch(queue.get_nowait(), queue)
+                return
+    finally:
+        get_task.cancel()
+
 
 @router.post(
     path="/run",
@@ -39,8 +134,7 @@ async def run(request_data: HedgeFundRequest, request: Request, uow: UnitOfWorkD
         # Hydrate API keys from database if not provided
         if not request_data.api_keys:
             repo = uow.get_repository(ApiKey)
-            api_keys = await repo.get_all_api_keys(include_inactive=False)
-            request_data.api_keys = {k.provider: k.key_value for k in api_keys}
+            request_data.api_keys = await repo.get_active_provider_key_map()
 
         # Create the crypto portfolio
         portfolio = {
@@ -55,22 +149,11 @@ async def run(request_data: HedgeFundRequest, request: Request, uow: UnitOfWorkD
             "realized_gains": dict.fromkeys(request_data.tickers, 0.0),
         }
 
-        # Use GraphService to create workflow from graph structure
-        graph_service = GraphService()
-        graph = graph_service.create_graph(
-            graph_nodes=request_data.graph_nodes,
-            graph_edges=request_data.graph_edges if hasattr(request_data, "graph_edges") else [],
-        )
-        graph = graph.compile()
-
         # Log a test progress update for debugging
         progress_tracker = get_progress()
         progress_tracker.update_status("system", None, "Preparing hedge fund run")
 
-        # Convert model_provider to string if it's an enum
         model_provider = request_data.model_provider
-        if hasattr(model_provider, "value"):
-            model_provider = model_provider.value
 
         # Function to detect client disconnection
         async def wait_for_disconnect():
@@ -86,7 +169,7 @@ async def run(request_data: HedgeFundRequest, request: Request, uow: UnitOfWorkD
         # Set up streaming response
         async def event_generator():
             # Queue for progress updates
-            progress_queue = asyncio.Queue()
+            progress_queue = asyncio.Queue(maxsize=PROGRESS_QUEUE_MAXSIZE)
             run_task = None
             disconnect_task = None
 
@@ -95,7 +178,7 @@ async def run(request_data: HedgeFundRequest, request: Request, uow: UnitOfWorkD
                 event = ProgressUpdateEvent(
                     agent=agent_name, ticker=ticker, status=status, timestamp=timestamp, analysis=analysis
                 )
-                progress_queue.put_nowait(event)
+                put_progress_event(progress_queue, event)
 
             # Register our handler with the progress tracker
             progress_tracker.register_handler(progress_handler)
@@ -118,28 +201,21 @@ async def run(request_data: HedgeFundRequest, request: Request, uow: UnitOfWorkD
                 disconnect_task = asyncio.create_task(wait_for_disconnect())
 
                 # Send initial message
-                yield StartEvent().to_sse()
+                yield StartEvent().to_sse_bytes()
 
                 # Stream progress updates until run_task completes or client disconnects
-                while not run_task.done():
-                    # Check if client disconnected
-                    if disconnect_task.done():
-                        logger.info(
-                            "Client disconnected, cancelling hedge fund execution",
-                            endpoint="hedge_fund/run",
-                        )
-                        run_task.cancel()
-                        with contextlib.suppress(asyncio.CancelledError):
-                            await run_task
-                        return
-
-                    # Either get a progress update or wait a bit
-                    try:
-                        event = await asyncio.wait_for(progress_queue.get(), timeout=1.0)
-                        yield event.to_sse()
-                    except TimeoutError:
-                        # Just continue the loop
-                        pass
+                async for chunk in astream_progress_events(progress_queue, run_task, disconnect_task):
+                    yield chunk
+
+                if not run_task.done():
+                    logger.info(
+                        "Client disconnected, cancelling hedge fund execution",
+                        endpoint="hedge_fund/run",
+                    )
+                    run_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await run_task
+                    return
 
                 # Get the final result
                 try:
@@ -149,20 +225,19 @@ async def run(request_data: HedgeFundRequest, request: Request, uow: UnitOfWorkD
                     return
 
                 if not result or not result.get("messages"):
-                    yield ErrorEvent(message="Failed to generate hedge fund decisions").to_sse()
+                    yield ErrorEvent(message="Failed to generate hedge fund decisions").to_sse_bytes()
                     return
 
                 # Send the final result
-                graph_service = GraphService()
                 final_data = CompleteEvent(
                     data={
-                        "decisions": graph_service.parse_hedge_fund_response(result.get("messages", [])[-1].content),
+                        "decisions": GraphService.parse_hedge_fund_response(result.get("messages", [])[-1].content),
                         "analyst_signals": result.get("data", {}).get("analyst_signals", {}),
                         "risk_signals": result.get("data", {}).get("risk_signals", {}),
                         "current_prices": result.get("data", {}).get("current_prices", {}),
                     }
                 )
-                yield final_data.to_sse()
+                yield final_data.to_sse_bytes()
 
             except asyncio.CancelledError:
                 logger.info("Hedge fund event generator cancelled", endpoint="hedge_fund/run")
@@ -200,13 +275,9 @@ async def backtest(request_data: BacktestRequest, request: Request, uow: UnitOfW
         # Hydrate API keys from database if not provided
         if not request_data.api_keys:
             repo = uow.get_repository(ApiKey)
-            api_keys = await repo.get_all_api_keys(include_inactive=False)
-            request_data.api_keys = {k.provider: k.key_value for k in api_keys}
+            request_data.api_keys = await repo.get_active_provider_key_map()
 
-        # Convert model_provider to string if it's an enum
         model_provider = request_data.model_provider
-        if hasattr(model_provider, "value"):
-            model_provider = model_provider.value
 
         # Create crypto backtest service using the new refactored system
         backtest_service = CryptoBacktestService(
@@ -219,6 +290,8 @@ async def backtest(request_data: BacktestRequest, request: Request, uow: UnitOfW
             selected_analysts=request_data.graph_nodes,
         )
 
+        progress_tracker = get_progress()
+
         # Function to detect client disconnection
         async def wait_for_disconnect():
             """Wait for client disconnect and return True when it happens."""
@@ -232,7 +305,7 @@ async def backtest(request_data: BacktestRequest, request: Request, uow: UnitOfW
 
         # Set up streaming response
         async def event_generator():
-            progress_queue = asyncio.Queue()
+            progress_queue = asyncio.Queue(maxsize=PROGRESS_QUEUE_MAXSIZE)
             backtest_task = None
             disconnect_task = None
 
@@ -241,7 +314,7 @@ async def backtest(request_data: BacktestRequest, request: Request, uow: UnitOfW
                 event = ProgressUpdateEvent(
                     agent=agent_name, ticker=ticker, status=status, timestamp=timestamp, analysis=analysis
                 )
-                progress_queue.put_nowait(event)
+                put_progress_event(progress_queue, event)
 
             # Progress callback to handle backtest-specific updates
             def progress_callback(update):
@@ -253,27 +326,25 @@ async def backtest(request_data: BacktestRequest, request: Request, uow: UnitOfW
                         timestamp=None,
                         analysis=None,
                     )
-                    progress_queue.put_nowait(event)
+                    put_progress_event(progress_queue, event)
                 elif update["type"] == "backtest_result":
-                    # Convert day result to a streaming event
-                    backtest_result = BacktestDayResult(**update["data"])
+                    # Read the summary fields straight from the day result; no need to validate the whole model
+                    day_result = update["data"]
+                    portfolio_value = float(day_result["portfolio_value"])
 
                     # Send the full day result data as JSON in the analysis field
-                    import json
-
-                    analysis_data = json.dumps(update["data"])
+                    analysis_data = orjson.dumps(day_result, default=str).decode()
 
                     event = ProgressUpdateEvent(
                         agent="backtest",
                         ticker=None,
-                        status=f"Completed {backtest_result.date} - Portfolio: ${backtest_result.portfolio_value:,.2f}",
+                        status=f"Completed {day_result['date']} - Portfolio: ${portfolio_value:,.2f}",
                         timestamp=None,
                         analysis=analysis_data,
                     )
-                    progress_queue.put_nowait(event)
+                    put_progress_event(progress_queue, event)
 
             # Register our handler with the progress tracker to capture agent updates
-            progress_tracker = get_progress()
             progress_tracker.register_handler(progress_handler)
 
             try:
@@ -286,28 +357,21 @@ async def backtest(request_data: BacktestRequest, request: Request, uow: UnitOfW
                 disconnect_task = asyncio.create_task(wait_for_disconnect())
 
                 # Send initial message
-                yield StartEvent().to_sse()
+                yield StartEvent().to_sse_bytes()
 
                 # Stream progress updates until backtest_task completes or client disconnects
-                while not backtest_task.done():
-                    # Check if client disconnected
-                    if disconnect_task.done():
-                        logger.info(
-                            "Client disconnected, cancelling backtest execution",
-                            endpoint="hedge_fund/backtest",
-                        )
-                        backtest_task.cancel()
-                        with contextlib.suppress(asyncio.CancelledError):
-                            await backtest_task
-                        return
-
-                    # Either get a progress update or wait a bit
-                    try:
-                        event = await asyncio.wait_for(progress_queue.get(), timeout=1.0)
-                        yield event.to_sse()
-                    except TimeoutError:
-                        # Just continue the loop
-                        pass
+                async for chunk in astream_progress_events(progress_queue, backtest_task, disconnect_task):
+                    yield chunk
+
+                if not backtest_task.done():
+                    logger.info(
+                        "Client disconnected, cancelling backtest execution",
+                        endpoint="hedge_fund/backtest",
+                    )
+                    backtest_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await backtest_task
+                    return
 
                 # Get the final result
                 try:
@@ -317,19 +381,20 @@ async def backtest(request_data: BacktestRequest, request: Request, uow: UnitOfW
                     return
 
                 if not result:
-                    yield ErrorEvent(message="Failed to complete backtest").to_sse()
+                    yield ErrorEvent(message="Failed to complete backtest").to_sse_bytes()
                     return
 
-                # Send the final result
-                performance_metrics = BacktestPerformanceMetrics(**result["performance_metrics"])
+                # Send the final result; the validated metrics model is serialized in place
+                # by pydantic-core instead of being dumped to an intermediate dict first
+                performance_metrics = BacktestPerformanceMetrics.model_validate(result["performance_metrics"])
                 final_data = CompleteEvent(
                     data={
-                        "performance_metrics": performance_metrics.model_dump(),
+                        "performance_metrics": performance_metrics,
                         "final_portfolio": result["final_portfolio"],
                         "total_days": len(result["results"]),
                     }
                 )
-                yield final_data.to_sse()
+                yield final_data.to_sse_bytes()
 
             except asyncio.CancelledError:
                 logger.info("Backtest event generator cancelled", endpoint="hedge_fund/backtest")
@@ -1,13 +1,36 @@
 """Language model endpoints for listing available models and providers."""
 
+from collections import defaultdict
+from functools import lru_cache
+
+import orjson
 from app.backend.api.schemas import ErrorResponse
-from app.backend.api.utils.error_handling import handle_http_exceptions
 from app.backend.src.llm.manager import list_available_models
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 
 router = APIRouter(prefix="/language-models", tags=["language-models"])
 
 
+@lru_cache(maxsize=1)
+def get_grouped_providers() -> bytes:
+    """
+    Group the available models by provider and serialize the result.
+
+    The model list is static for the life of the process, so the grouping is built
+    and encoded once; call ``get_grouped_providers.cache_clear()`` if the model list changes.
+
+    Returns
+    -------
+    bytes
+        JSON response body with providers in first-seen order and their models.
+    """
+    grouped = defaultdict(list)
+    for model in list_available_models():
+        grouped[model["provider"]].append({"display_name": model["display_name"], "model_name": model["model_name"]})
+
+    return orjson.dumps({"providers": [{"name": name, "models": models} for name, models in grouped.items()]})
+
+
 @router.get(
     "/",
     responses={
@@ -15,7 +38,6 @@ router = APIRouter(prefix="/language-models", tags=["language-models"])
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-@handle_http_exceptions
 async def get_language_models():
     """Get the list of available cloud-based language models."""
     models = list_available_models()
@@ -29,19 +51,6 @@ async def get_language_models():
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-@handle_http_exceptions
 async def get_language_model_providers():
     """Get the list of available model providers with their models grouped."""
-    models = list_available_models()
-
-    # Group models by provider
-    providers = {}
-    for model in models:
-        provider_name = model["provider"]
-        if provider_name not in providers:
-            providers[provider_name] = {"name": provider_name, "models": []}
-        providers[provider_name]["models"].append(
-            {"display_name": model["display_name"], "model_name": model["model_name"]}
-        )
-
-    return {"providers": list(providers.values())}
+    return Response(content=get_grouped_providers(), media_type="application/json")
@@ -1,14 +1,59 @@
 """Storage endpoints for file operations."""
 
+import asyncio
 import json
+from functools import lru_cache
 from pathlib import Path
 
+import orjson
 from app.backend.api.schemas import ErrorResponse, SaveJsonRequest
-from app.backend.api.utils.error_handling import handle_http_exceptions
 from fastapi import APIRouter
 
 router = APIRouter(prefix="/storage", tags=["storage"])
 
+# Project-level directory that saved JSON files are written to
+OUTPUTS_DIR = Path(__file__).resolve().parents[3] / "outputs"
+
+
+@lru_cache(maxsize=1)
+def get_outputs_dir() -> Path:
+    """
+    Get the outputs directory, creating it on first use only.
+
+    Returns
+    -------
+    Path
+        Existing outputs directory
+    """
+    OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
+    return OUTPUTS_DIR
+
+
+def write_json_file(filename: str, data: dict) -> Path:
+    """
+    Encode data as indented JSON and write it to the outputs directory in a single write.
+
+    Parameters
+    ----------
+    filename : str
+        Bare file name inside the outputs directory
+    data : dict
+        JSON-serializable data
+
+    Returns
+    -------
+    Path
+        Path of the written file
+    """
+    file_path = get_outputs_dir() / filename
+    try:
+        content = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        # orjson rejects integers wider than 64 bits; the stdlib encoder handles them
+        content = json.dumps(data, indent=2, ensure_ascii=False).encode()
+    file_path.write_bytes(content)
+    return file_path
+
 
 @router.post(
     "/save-json",
@@ -18,20 +63,12 @@ router = APIRouter(prefix="/storage", tags=["storage"])
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
 )
-@handle_http_exceptions
 async def save_json_file(request: SaveJsonRequest):
     """Save JSON data to the project's /outputs directory."""
-    # Create outputs directory if it doesn't exist
-    project_root = Path(__file__).parent.parent.parent.parent
-    outputs_dir = project_root / "outputs"
-    outputs_dir.mkdir(exist_ok=True)
-
-    # Construct file path
-    file_path = outputs_dir / request.filename
-
-    # Save JSON data to file
-    with file_path.open("w", encoding="utf-8") as f:
-        json.dump(request.data, f, indent=2, ensure_ascii=False)
+    # Filename is validated as a bare name, so it cannot escape the outputs directory.
+    # Encoding and writing run in a worker thread so large payloads don't block the event loop.
+    loop = asyncio.get_running_loop()
+    file_path = await loop.run_in_executor(None, write_json_file, request.filename, request.data)
 
     return {
         "success": True,
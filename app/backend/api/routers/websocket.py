@@ -1,9 +1,14 @@
 """WebSocket endpoints for real-time cryptocurrency trading."""
 
-import json
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
 from datetime import datetime
 
+import orjson
 import structlog
+from app.backend.api.dependencies import WorkflowEngineDep
 from app.backend.api.schemas import StartStreamingRequest, StopStreamingRequest
 from app.backend.src.agents.streaming_agent import WorkflowEngine
 from app.backend.src.tools.crypto.websocket_client import MockWebSocketClient
@@ -12,13 +17,104 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 logger = structlog.stdlib.get_logger(__name__)
 router = APIRouter()
 
+# Outbound messages buffered per client before the oldest are dropped
+OUTBOUND_QUEUE_MAXSIZE = 256
+# How long a formatted message timestamp is reused before the clock is read again
+TIMESTAMP_RESOLUTION_SECONDS = 0.05
+
+
+class CachedTimestamp:
+    """ISO-8601 local timestamp that is re-formatted at most once per resolution window."""
+
+    def __init__(self, resolution: float = TIMESTAMP_RESOLUTION_SECONDS):
+        """
+        Initialize the cached timestamp.
+
+        Parameters
+        ----------
+        resolution : float
+            Seconds a formatted timestamp stays valid
+        """
+        self.resolution = resolution
+        self.expires_at = 0.0
+        self.value = ""
+
+    def now(self) -> str:
+        """
+        Get the current timestamp, reusing the cached string inside the resolution window.
+
+        Returns
+        -------
+        str
+            ISO-8601 formatted local time
+        """
+        current = time.monotonic()
+        if current >= self.expires_at:
+            self.value = datetime.now().isoformat()
+            self.expires_at = current + self.resolution
+        return self.value
+
+
+# Invariant reply sent for frames that are not valid JSON
+INVALID_JSON_MESSAGE = orjson.dumps({"type": "error", "message": "Invalid JSON"}).decode()
+# Constant framing around the payload of an echo reply
+ECHO_MESSAGE_PREFIX = '{"type":"echo","message":'
+ECHO_MESSAGE_SUFFIX = "}"
+
+
+def echo_message(message: str) -> str:
+    """
+    Build an echo reply, encoding only the echoed text.
+
+    Parameters
+    ----------
+    message : str
+        Text received from the client
+
+    Returns
+    -------
+    str
+        Serialized echo message
+    """
+    return ECHO_MESSAGE_PREFIX + orjson.dumps(message).decode() + ECHO_MESSAGE_SUFFIX
+
+
+def coalesce_outbound(batch: list[tuple[str | None, str]]) -> list[str]:
+    """
+    Collapse queued messages that share a coalesce key, keeping only the latest.
+
+    Parameters
+    ----------
+    batch : list[tuple[str | None, str]]
+        ``(coalesce_key, message)`` pairs in queue order; messages without a key are never merged.
+
+    Returns
+    -------
+    list[str]
+        Messages to send, in queue order.
+    """
+    latest = {key: index for index, (key, _) in enumerate(batch) if key is not None}
+    return [message for index, (key, message) in enumerate(batch) if key is None or latest[key] == index]
+
 
 class WebSocketManager:
-    """Manages WebSocket connections and broadcasting."""
+    """
+    Manages WebSocket connections and broadcasting.
+
+    Each connection gets a bounded outbound queue drained by its own writer task,
+    so producers only enqueue and a slow client cannot stall the others. Replies
+    from the receive loops go through the same queue, keeping one writer per socket.
+    """
 
     def __init__(self):
         """Initialize WebSocket manager."""
-        self.active_connections: dict[str, list[WebSocket]] = {}
+        self.active_connections: dict[str, set[WebSocket]] = {}
+        # Reverse index so connect/disconnect never scan every channel
+        self.connection_channels: dict[WebSocket, set[str]] = {}
+        self.outbound_queues: dict[WebSocket, asyncio.Queue] = {}
+        self.writer_tasks: dict[WebSocket, asyncio.Task] = {}
+        # Clock for outbound message timestamps, shared by every connection
+        self.clock = CachedTimestamp()
 
     async def connect(self, websocket: WebSocket, channel: str):
         """
@@ -33,9 +129,12 @@ class WebSocketManager:
         """
         await websocket.accept()
 
-        if channel not in self.active_connections:
-            self.active_connections[channel] = []
-        self.active_connections[channel].append(websocket)
+        self.active_connections.setdefault(channel, set()).add(websocket)
+        self.connection_channels.setdefault(websocket, set()).add(channel)
+        if websocket not in self.outbound_queues:
+            queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_MAXSIZE)
+            self.outbound_queues[websocket] = queue
+            self.writer_tasks[websocket] = asyncio.create_task(self.awrite_outbound(websocket, queue))
 
     async def disconnect(self, websocket: WebSocket, channel: str):
         """
@@ -48,8 +147,86 @@ class WebSocketManager:
         channel : str
             Channel name
         """
-        if channel in self.active_connections and websocket in self.active_connections[channel]:
-            self.active_connections[channel].remove(websocket)
+        self.remove_from_channel(websocket, channel)
+
+        if not self.connection_channels.get(websocket):
+            self.connection_channels.pop(websocket, None)
+            self.outbound_queues.pop(websocket, None)
+            writer_task = self.writer_tasks.pop(websocket, None)
+            if writer_task:
+                writer_task.cancel()
+
+    def remove_from_channel(self, websocket: WebSocket, channel: str) -> None:
+        """
+        Remove a connection from one channel, dropping the channel once it is empty.
+
+        Parameters
+        ----------
+        websocket : WebSocket
+            WebSocket connection
+        channel : str
+            Channel name
+        """
+        connections = self.active_connections.get(channel)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
+                del self.active_connections[channel]
+
+        channels = self.connection_channels.get(websocket)
+        if channels is not None:
+            channels.discard(channel)
+
+    def enqueue(self, websocket: WebSocket, message: str, coalesce_key: str | None = None) -> None:
+        """
+        Queue a serialized message for a connection without waiting on the socket.
+
+        Parameters
+        ----------
+        websocket : WebSocket
+            WebSocket connection
+        message : str
+            Serialized JSON message
+        coalesce_key : str | None
+            Messages with the same key still queued are replaced by the newest one
+        """
+        queue = self.outbound_queues.get(websocket)
+        if queue is None:
+            return
+
+        if queue.full():
+            # Slow client: drop its oldest pending message rather than grow without bound
+            with contextlib.suppress(asyncio.QueueEmpty):
+                queue.get_nowait()
+        queue.put_nowait((coalesce_key, message))
+
+    async def awrite_outbound(self, websocket: WebSocket, queue: asyncio.Queue):
+        """
+        Drain a connection's outbound queue onto its socket.
+
+        Parameters
+        ----------
+        websocket : WebSocket
+            WebSocket connection
+        queue : asyncio.Queue
+            Outbound queue of ``(coalesce_key, message)`` pairs
+        """
+        try:
+            while True:
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                for message in coalesce_outbound(batch):
+                    await websocket.send_text(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.exception("Error sending to WebSocket", error=str(e))
+            for channel in self.connection_channels.pop(websocket, set()):
+                self.remove_from_channel(websocket, channel)
+            self.outbound_queues.pop(websocket, None)
+            self.writer_tasks.pop(websocket, None)
 
     async def broadcast(self, channel: str, data: dict):
         """
@@ -62,21 +239,16 @@ class WebSocketManager:
         data : dict
             Data to broadcast
         """
-        if channel in self.active_connections:
-            dead_connections = []
+        connections = self.active_connections.get(channel)
+        if not connections:
+            return
 
-            for connection in self.active_connections[channel]:
-                try:
-                    await connection.send_json(data)
-                except Exception as e:
-                    logger.exception("Error broadcasting to WebSocket", error=str(e))
-                    dead_connections.append(connection)
+        # Serialize once for every client on the channel
+        message = orjson.dumps(data, default=str).decode()
+        for connection in connections:
+            self.enqueue(connection, message)
 
-            # Remove dead connections
-            for connection in dead_connections:
-                self.active_connections[channel].remove(connection)
-
-    async def send_to_connection(self, websocket: WebSocket, data: dict):
+    async def send_to_connection(self, websocket: WebSocket, data: dict, coalesce_key: str | None = None):
         """
         Send data to a specific WebSocket connection.
 
@@ -86,11 +258,10 @@ class WebSocketManager:
             WebSocket connection
         data : dict
             Data to send
+        coalesce_key : str | None
+            Key under which only the latest queued message is kept, e.g. a ticker symbol
         """
-        try:
-            await websocket.send_json(data)
-        except Exception as e:
-            logger.exception("Error sending to WebSocket", error=str(e))
+        self.enqueue(websocket, orjson.dumps(data, default=str).decode(), coalesce_key=coalesce_key)
 
 
 # Instantiate WebSocket manager at module level
@@ -123,8 +294,9 @@ async def crypto_data_stream(websocket: WebSocket, symbol: str):
                     "type": "crypto_data",
                     "symbol": symbol,
                     "data": data.dict() if hasattr(data, "dict") else data,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": websocket_manager.clock.now(),
                 },
+                coalesce_key=f"crypto_data:{symbol}",
             )
 
         # Subscribe to ticker data
@@ -135,7 +307,7 @@ async def crypto_data_stream(websocket: WebSocket, symbol: str):
             try:
                 message = await websocket.receive_text()
                 # Echo back for connection testing
-                await websocket.send_json({"type": "echo", "message": message})
+                websocket_manager.enqueue(websocket, echo_message(message))
             except WebSocketDisconnect:
                 break
 
@@ -148,7 +320,7 @@ async def crypto_data_stream(websocket: WebSocket, symbol: str):
 
 
 @router.websocket("/ws/agent-signals")
-async def agent_signals_stream(websocket: WebSocket):
+async def agent_signals_stream(websocket: WebSocket, workflow_engine: WorkflowEngineDep):
     """
     WebSocket endpoint for real-time agent signals.
 
@@ -156,6 +328,8 @@ async def agent_signals_stream(websocket: WebSocket):
     ----------
     websocket : WebSocket
         WebSocket connection
+    workflow_engine : WorkflowEngine
+        Application workflow engine
     """
     channel = "agent_signals"
     await websocket_manager.connect(websocket, channel)
@@ -165,23 +339,24 @@ async def agent_signals_stream(websocket: WebSocket):
         while True:
             try:
                 message = await websocket.receive_text()
-                data = json.loads(message)
+                data = orjson.loads(message)
 
                 if data.get("type") == "subscribe_agent":
                     # Subscribe to specific agent signals
                     agent_id = data.get("agent_id")
                     if agent_id:
-                        workflow_engine = WorkflowEngine()
                         workflow_engine.subscribe_agent_to_websocket(agent_id, websocket)
 
                 elif data.get("type") == "ping":
                     # Respond to ping
-                    await websocket.send_json({"type": "pong", "timestamp": datetime.now().isoformat()})
+                    await websocket_manager.send_to_connection(
+                        websocket, {"type": "pong", "timestamp": websocket_manager.clock.now()}
+                    )
 
             except WebSocketDisconnect:
                 break
-            except json.JSONDecodeError:
-                await websocket.send_json({"type": "error", "message": "Invalid JSON"})
+            except orjson.JSONDecodeError:
+                websocket_manager.enqueue(websocket, INVALID_JSON_MESSAGE)
 
     except WebSocketDisconnect:
         pass
@@ -210,7 +385,7 @@ async def portfolio_updates_stream(websocket: WebSocket):
             try:
                 message = await websocket.receive_text()
                 # Echo back for connection testing
-                await websocket.send_json({"type": "echo", "message": message})
+                websocket_manager.enqueue(websocket, echo_message(message))
             except WebSocketDisconnect:
                 break
 
@@ -222,8 +397,95 @@ async def portfolio_updates_stream(websocket: WebSocket):
         await websocket_manager.disconnect(websocket, channel)
 
 
+async def astart_workflow_message(websocket: WebSocket, workflow_engine: WorkflowEngine, data: dict):
+    """Start a new workflow from a ``start_workflow`` control message."""
+    request_data = data.get("data", {})
+    symbols = request_data.get("symbols", [])
+    exchanges = request_data.get("exchanges", ["binance", "coinbase"])
+    agents = request_data.get("agents", [])
+
+    await workflow_engine.start_workflow(symbols, agents, exchanges)
+
+    await websocket_manager.send_to_connection(
+        websocket,
+        {
+            "type": "workflow_started",
+            "symbols": symbols,
+            "agents": [agent["name"] for agent in agents],
+            "timestamp": websocket_manager.clock.now(),
+        },
+    )
+
+
+async def astop_workflow_message(websocket: WebSocket, workflow_engine: WorkflowEngine, _: dict):
+    """Stop the running workflow."""
+    await workflow_engine.stop_workflow()
+
+    await websocket_manager.send_to_connection(
+        websocket, {"type": "workflow_stopped", "timestamp": websocket_manager.clock.now()}
+    )
+
+
+async def aget_status_message(websocket: WebSocket, workflow_engine: WorkflowEngine, _: dict):
+    """Report the current workflow status."""
+    status = await workflow_engine.get_workflow_status()
+
+    await websocket_manager.send_to_connection(
+        websocket, {"type": "workflow_status", "status": status, "timestamp": websocket_manager.clock.now()}
+    )
+
+
+async def aadd_agent_message(websocket: WebSocket, workflow_engine: WorkflowEngine, data: dict):
+    """Add a new agent from an ``add_agent`` control message."""
+    agent_data = data.get("data", {})
+    config = {
+        "name": agent_data.get("name"),
+        "description": agent_data.get("description", ""),
+        "persona": agent_data.get("persona", ""),
+    }
+    symbols = agent_data.get("symbols", [])
+    exchanges = agent_data.get("exchanges", ["binance", "coinbase"])
+
+    await workflow_engine.add_agent(config, symbols, exchanges)
+
+    await websocket_manager.send_to_connection(
+        websocket,
+        {
+            "type": "agent_added",
+            "agent_id": config["name"],
+            "timestamp": websocket_manager.clock.now(),
+        },
+    )
+
+
+async def aremove_agent_message(websocket: WebSocket, workflow_engine: WorkflowEngine, data: dict):
+    """Remove the agent named in a ``remove_agent`` control message."""
+    agent_id = data.get("agent_id")
+    await workflow_engine.remove_agent(agent_id)
+
+    await websocket_manager.send_to_connection(
+        websocket, {"type": "agent_removed", "agent_id": agent_id, "timestamp": websocket_manager.clock.now()}
+    )
+
+
+async def aping_message(websocket: WebSocket, _workflow_engine: WorkflowEngine, _: dict):
+    """Respond to a ping."""
+    await websocket_manager.send_to_connection(websocket, {"type": "pong", "timestamp": websocket_manager.clock.now()})
+
+
+# Workflow control message handlers keyed by message type; unknown types are ignored
+WORKFLOW_CONTROL_HANDLERS: dict[str, Callable[[WebSocket, WorkflowEngine, dict], Awaitable[None]]] = {
+    "start_workflow": astart_workflow_message,
+    "stop_workflow": astop_workflow_message,
+    "get_status": aget_status_message,
+    "add_agent": aadd_agent_message,
+    "remove_agent": aremove_agent_message,
+    "ping": aping_message,
+}
+
+
 @router.websocket("/ws/workflow-control")
-async def workflow_control_stream(websocket: WebSocket):
+async def workflow_control_stream(websocket: WebSocket, workflow_engine: WorkflowEngineDep):
     """
     WebSocket endpoint for real-time workflow control.
 
@@ -231,92 +493,30 @@ async def workflow_control_stream(websocket: WebSocket):
     ----------
     websocket : WebSocket
         WebSocket connection
+    workflow_engine : WorkflowEngine
+        Application workflow engine
     """
     channel = "workflow_control"
     await websocket_manager.connect(websocket, channel)
 
     try:
-        workflow_engine = WorkflowEngine()
-
         while True:
             try:
                 message = await websocket.receive_text()
-                data = json.loads(message)
-
-                if data.get("type") == "start_workflow":
-                    # Start a new workflow
-                    request_data = data.get("data", {})
-                    symbols = request_data.get("symbols", [])
-                    exchanges = request_data.get("exchanges", ["binance", "coinbase"])
-                    agents = request_data.get("agents", [])
-
-                    await workflow_engine.start_workflow(symbols, agents, exchanges)
-
-                    await websocket.send_json(
-                        {
-                            "type": "workflow_started",
-                            "symbols": symbols,
-                            "agents": [agent["name"] for agent in agents],
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                    )
-
-                elif data.get("type") == "stop_workflow":
-                    # Stop the workflow
-                    await workflow_engine.stop_workflow()
-
-                    await websocket.send_json({"type": "workflow_stopped", "timestamp": datetime.now().isoformat()})
-
-                elif data.get("type") == "get_status":
-                    # Get workflow status
-                    status = await workflow_engine.get_workflow_status()
-
-                    await websocket.send_json(
-                        {"type": "workflow_status", "status": status, "timestamp": datetime.now().isoformat()}
-                    )
-
-                elif data.get("type") == "add_agent":
-                    # Add a new agent
-                    agent_data = data.get("data", {})
-                    config = {
-                        "name": agent_data.get("name"),
-                        "description": agent_data.get("description", ""),
-                        "persona": agent_data.get("persona", ""),
-                    }
-                    symbols = agent_data.get("symbols", [])
-                    exchanges = agent_data.get("exchanges", ["binance", "coinbase"])
+                data = orjson.loads(message)
 
-                    await workflow_engine.add_agent(config, symbols, exchanges)
-
-                    await websocket.send_json(
-                        {
-                            "type": "agent_added",
-                            "agent_id": config["name"],
-                            "timestamp": datetime.now().isoformat(),
-                        }
-                    )
-
-                elif data.get("type") == "remove_agent":
-                    # Remove an agent
-                    agent_id = data.get("agent_id")
-                    await workflow_engine.remove_agent(agent_id)
-
-                    await websocket.send_json(
-                        {"type": "agent_removed", "agent_id": agent_id, "timestamp": datetime.now().isoformat()}
-                    )
-
-                elif data.get("type") == "ping":
-                    # Respond to ping
-                    await websocket.send_json({"type": "pong", "timestamp": datetime.now().isoformat()})
+                handler = WORKFLOW_CONTROL_HANDLERS.get(data.get("type"))
+                if handler:
+                    await handler(websocket, workflow_engine, data)
 
             except WebSocketDisconnect:
                 break
-            except json.JSONDecodeError:
-                await websocket.send_json({"type": "error", "message": "Invalid JSON"})
+            except orjson.JSONDecodeError:
+                websocket_manager.enqueue(websocket, INVALID_JSON_MESSAGE)
             except Exception as e:
                 logger.exception("Error in workflow control", error=str(e))
-                await websocket.send_json(
-                    {"type": "error", "message": str(e), "timestamp": datetime.now().isoformat()}
+                await websocket_manager.send_to_connection(
+                    websocket, {"type": "error", "message": str(e), "timestamp": websocket_manager.clock.now()}
                 )
 
     except WebSocketDisconnect:
@@ -328,7 +528,7 @@ async def workflow_control_stream(websocket: WebSocket):
 
 
 @router.post("/streaming/start")
-async def start_streaming(request: StartStreamingRequest):
+async def start_streaming(request: StartStreamingRequest, workflow_engine: WorkflowEngineDep):
     """
     Start real-time streaming for specified symbols and agents.
 
@@ -336,6 +536,8 @@ async def start_streaming(request: StartStreamingRequest):
     ----------
     request : StartStreamingRequest
         Streaming configuration request
+    workflow_engine : WorkflowEngine
+        Application workflow engine
 
     Returns
     -------
@@ -343,8 +545,6 @@ async def start_streaming(request: StartStreamingRequest):
         Response with streaming status
     """
     try:
-        workflow_engine = WorkflowEngine()
-
         await workflow_engine.start_workflow(
             symbols=request.symbols, agent_configs=request.agents, exchanges=request.exchanges
         )
@@ -363,12 +563,14 @@ async def start_streaming(request: StartStreamingRequest):
 
 
 @router.post("/streaming/stop")
-async def stop_streaming(_: StopStreamingRequest | None = None):
+async def stop_streaming(workflow_engine: WorkflowEngineDep, _: StopStreamingRequest | None = None):
     """
     Stop real-time streaming.
 
     Parameters
     ----------
+    workflow_engine : WorkflowEngine
+        Application workflow engine
     request : StopStreamingRequest
         Stop streaming request
 
@@ -378,7 +580,6 @@ async def stop_streaming(_: StopStreamingRequest | None = None):
         Response with streaming status
     """
     try:
-        workflow_engine = WorkflowEngine()
         await workflow_engine.stop_workflow()
 
         return {"status": "success", "message": "Streaming stopped", "timestamp": datetime.now().isoformat()}
@@ -389,17 +590,21 @@ async def stop_streaming(_: StopStreamingRequest | None = None):
 
 
 @router.get("/streaming/status")
-async def get_streaming_status():
+async def get_streaming_status(workflow_engine: WorkflowEngineDep):
     """
     Get current streaming status.
 
+    Parameters
+    ----------
+    workflow_engine : WorkflowEngine
+        Application workflow engine
+
     Returns
     -------
     dict
         Current streaming status
     """
     try:
-        workflow_engine = WorkflowEngine()
         status = await workflow_engine.get_workflow_status()
 
         return {"status": "success", "data": status, "timestamp": datetime.now().isoformat()}
@@ -432,38 +637,35 @@ async def council_trades_stream(websocket: WebSocket):
         while True:
             try:
                 message = await websocket.receive_text()
-                data = json.loads(message)
+                data = orjson.loads(message)
 
                 if data.get("type") == "ping":
                     # Respond to ping
-                    await websocket.send_json(
+                    await websocket_manager.send_to_connection(
+                        websocket,
                         {
                             "type": "pong",
-                            "timestamp": datetime.now().isoformat(),
-                        }
+                            "timestamp": websocket_manager.clock.now(),
+                        },
                     )
 
                 elif data.get("type") == "subscribe_council":
                     # Subscribe to specific council updates
                     council_id = data.get("council_id")
                     logger.info("Client subscribed to council", council_id=council_id)
-                    await websocket.send_json(
+                    await websocket_manager.send_to_connection(
+                        websocket,
                         {
                             "type": "subscription_confirmed",
                             "council_id": council_id,
-                            "timestamp": datetime.now().isoformat(),
-                        }
+                            "timestamp": websocket_manager.clock.now(),
+                        },
                     )
 
             except WebSocketDisconnect:
                 break
-            except json.JSONDecodeError:
-                await websocket.send_json(
-                    {
-                        "type": "error",
-                        "message": "Invalid JSON",
-                    }
-                )
+            except orjson.JSONDecodeError:
+                websocket_manager.enqueue(websocket, INVALID_JSON_MESSAGE)
             except Exception as e:
                 logger.exception("Error in council trades stream", error=str(e))
 
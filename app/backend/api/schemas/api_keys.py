@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ApiKeyCreateRequest(BaseModel):
@@ -32,8 +32,7 @@ class ApiKeyResponse(BaseModel):
     updated_at: datetime | None
     last_used: datetime | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ApiKeySummaryResponse(BaseModel):
@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CouncilCreateRequest(BaseModel):
@@ -56,35 +56,35 @@ class CouncilResponse(BaseModel):
     """Response with council details."""
 
     id: int
-    user_id: int | None
-    wallet_id: int | None
+    user_id: int | None = None
+    wallet_id: int | None = None
     is_system: bool
     is_public: bool
     is_template: bool
     name: str
-    description: str | None
-    strategy: str | None
-    tags: list[str] | None
+    description: str | None = None
+    strategy: str | None = None
+    tags: list[str] | None = None
     agents: dict
     connections: dict
-    workflow_config: dict | None
-    visual_layout: dict | None
+    workflow_config: dict | None = None
+    visual_layout: dict | None = None
     initial_capital: Decimal
-    risk_settings: dict | None
-    current_capital: Decimal | None
-    total_pnl: Decimal | None
-    total_pnl_percentage: Decimal | None
-    win_rate: Decimal | None
-    total_trades: int | None
-    status: str | None
+    risk_settings: dict | None = None
+    current_capital: Decimal | None = None
+    total_pnl: Decimal | None = None
+    total_pnl_percentage: Decimal | None = None
+    win_rate: Decimal | None = None
+    total_trades: int | None = None
+    status: str | None = None
     is_active: bool
-    created_at: datetime | None
-    updated_at: datetime | None
-    last_executed_at: datetime | None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    last_executed_at: datetime | None = None
     view_count: int
     fork_count: int
-    forked_from_id: int | None
-    meta_data: dict | None
+    forked_from_id: int | None = None
+    meta_data: dict | None = None
 
 
 class CouncilSummaryResponse(BaseModel):
@@ -112,10 +112,7 @@ class CouncilSummaryResponse(BaseModel):
     fork_count: int
     forked_from_id: int | None
 
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class CouncilRunCreateRequest(BaseModel):
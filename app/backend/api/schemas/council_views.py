@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -39,7 +40,8 @@ class TradeRecord(BaseModel):
     council_name: str | None = None
 
 
-class PerformanceDataPoint(BaseModel):
+@dataclass(slots=True)
+class PerformanceDataPoint:
     """Performance chart data point."""
 
     timestamp: datetime
@@ -72,20 +74,22 @@ class ConsensusDecisionResponse(BaseModel):
     created_at: datetime
 
 
-class AgentInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class AgentInfo:
     """Agent information from council."""
 
     id: str
     name: str
     type: str
     role: str | None
-    traits: list[str] | None
+    traits: tuple[str, ...] | None
     specialty: str | None
     system_prompt: str | None
     position: dict[str, Any] | None
 
 
-class PortfolioHoldingDetail(BaseModel):
+@dataclass(slots=True)
+class PortfolioHoldingDetail:
     """Portfolio holding detail."""
 
     quantity: float
@@ -133,7 +137,8 @@ class GlobalActivityResponse(BaseModel):
     councils: dict[int, str]
 
 
-class HoldTimes(BaseModel):
+@dataclass(slots=True)
+class HoldTimes:
     """Hold times breakdown."""
 
     long: float
@@ -2,7 +2,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class FlowRunStatus(str, Enum):
@@ -43,10 +43,7 @@ class FlowRunResponse(BaseModel):
     results: dict[str, Any] | None
     error_message: str | None
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FlowRunSummaryResponse(BaseModel):
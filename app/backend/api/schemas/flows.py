@@ -1,14 +1,17 @@
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Upper bound on nodes/edges per flow, so oversized graphs are rejected before they are walked
+MAX_FLOW_GRAPH_ITEMS = 2000
 
 
 class FlowCreateRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=200)
     description: str | None = None
-    nodes: list[dict[str, Any]]
-    edges: list[dict[str, Any]]
+    nodes: list[dict[str, Any]] = Field(..., max_length=MAX_FLOW_GRAPH_ITEMS)
+    edges: list[dict[str, Any]] = Field(..., max_length=MAX_FLOW_GRAPH_ITEMS)
     viewport: dict[str, Any] | None = None
     data: dict[str, Any] | None = None
     is_template: bool = False
@@ -18,8 +21,8 @@ class FlowCreateRequest(BaseModel):
 class FlowUpdateRequest(BaseModel):
     name: str | None = Field(None, min_length=1, max_length=200)
     description: str | None = None
-    nodes: list[dict[str, Any]] | None = None
-    edges: list[dict[str, Any]] | None = None
+    nodes: list[dict[str, Any]] | None = Field(None, max_length=MAX_FLOW_GRAPH_ITEMS)
+    edges: list[dict[str, Any]] | None = Field(None, max_length=MAX_FLOW_GRAPH_ITEMS)
     viewport: dict[str, Any] | None = None
     data: dict[str, Any] | None = None
     is_template: bool | None = None
@@ -39,8 +42,7 @@ class FlowResponse(BaseModel):
     created_at: datetime
     updated_at: datetime | None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class FlowSummaryResponse(BaseModel):
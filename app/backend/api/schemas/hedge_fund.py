@@ -1,9 +1,9 @@
-from datetime import datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
+from functools import cached_property
 from typing import Any
 
-from app.backend.services.graph import GraphService
 from app.backend.src.llm.base_client import ModelProvider
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .graph import GraphEdge, GraphNode
 
@@ -11,6 +11,8 @@ from .graph import GraphEdge, GraphNode
 class AgentModelConfig(BaseModel):
     """Configuration for agent model settings."""
 
+    model_config = ConfigDict(use_enum_values=True)
+
     agent_id: str
     model_name: str | None = None
     model_provider: ModelProvider | None = None
@@ -21,14 +23,7 @@ class PortfolioPosition(BaseModel):
 
     ticker: str
     quantity: float
-    trade_price: float
-
-    @field_validator("trade_price")
-    @classmethod
-    def price_must_be_positive(cls, v: float) -> float:
-        if v <= 0:
-            raise ValueError("Trade price must be positive!")
-        return v
+    trade_price: float = Field(..., gt=0, description="Trade price must be positive")
 
 
 class HedgeFundResponse(BaseModel):
@@ -39,6 +34,9 @@ class HedgeFundResponse(BaseModel):
 
 
 class BaseHedgeFundRequest(BaseModel):
+    # Store model_provider as its plain string value, including the default
+    model_config = ConfigDict(use_enum_values=True, validate_default=True)
+
     tickers: list[str]
     graph_nodes: list[GraphNode]
     graph_edges: list[GraphEdge]
@@ -53,19 +51,30 @@ class BaseHedgeFundRequest(BaseModel):
         """Extract agent IDs from graph structure."""
         return [node.id for node in self.graph_nodes]
 
-    def get_agent_model_config(self, agent_id: str) -> tuple[str, ModelProvider]:
+    @cached_property
+    def agent_model_index(self) -> dict[str, tuple[str, str]]:
+        """Map each base agent key to the first complete model configuration that targets it."""
+        # Imported lazily so the schema package doesn't pull in the graph service and LangGraph
+        from app.backend.services.graph import GraphService
+
+        index: dict[str, tuple[str, str]] = {}
+        for config in self.agent_models or []:
+            model_name = config.model_name or self.model_name
+            model_provider = config.model_provider or self.model_provider
+            if model_name and model_provider:
+                index.setdefault(GraphService.extract_base_agent_key(config.agent_id), (model_name, model_provider))
+        return index
+
+    def get_agent_model_config(self, agent_id: str) -> tuple[str, str]:
         """Get model configuration for a specific agent."""
-        if self.agent_models:
-            graph_service = GraphService()
-            base_agent_key = graph_service.extract_base_agent_key(agent_id)
-
-            for config in self.agent_models:
-                config_base_key = graph_service.extract_base_agent_key(config.agent_id)
-                if config.agent_id == agent_id or config_base_key == base_agent_key:
-                    model_name = config.model_name or self.model_name
-                    model_provider = config.model_provider or self.model_provider
-                    if model_name and model_provider:
-                        return (model_name, model_provider)
+        # Most requests carry no per-agent overrides; skip key extraction entirely for them
+        if self.agent_model_index:
+            from app.backend.services.graph import GraphService
+
+            # An exact agent_id match always shares the base key, so one lookup covers both cases
+            agent_config = self.agent_model_index.get(GraphService.extract_base_agent_key(agent_id))
+            if agent_config:
+                return agent_config
         if self.model_name and self.model_provider:
             return (self.model_name, self.model_provider)
         raise ValueError("No valid model configuration found")
@@ -109,12 +118,22 @@ class BacktestResponse(BaseModel):
 
 
 class HedgeFundRequest(BaseHedgeFundRequest):
-    end_date: str | None = Field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d"))
+    end_date: str | None = Field(default_factory=lambda: datetime.now(UTC).date().isoformat())
     start_date: str | None = None
     initial_cash: float = 100000.0
 
+    @field_validator("end_date")
+    @classmethod
+    def end_date_must_be_a_date(cls, value: str | None) -> str | None:
+        """Normalize end_date to zero-padded YYYY-MM-DD so get_start_date can parse it as ISO."""
+        if value is None:
+            return value
+        # Unpadded dates such as 2025-1-5 stay valid; anything else is a 422
+        year, month, day = (int(part) for part in value.split("-"))
+        return date(year, month, day).isoformat()
+
     def get_start_date(self) -> str:
         """Calculate start date if not provided."""
         if self.start_date:
             return self.start_date
-        return (datetime.strptime(self.end_date, "%Y-%m-%d") - timedelta(days=90)).strftime("%Y-%m-%d")
+        return (date.fromisoformat(self.end_date) - timedelta(days=90)).isoformat()
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from pathlib import PurePath
+
+from pydantic import BaseModel, field_validator
 
 
 class SaveJsonRequest(BaseModel):
@@ -6,3 +8,11 @@ class SaveJsonRequest(BaseModel):
 
     filename: str
     data: dict
+
+    @field_validator("filename")
+    @classmethod
+    def filename_must_be_plain(cls, v: str) -> str:
+        """Reject filenames that contain path components."""
+        if v in {"", ".", ".."} or "\\" in v or PurePath(v).name != v:
+            raise ValueError("Filename must not contain path components!")
+        return v
@@ -1,6 +1,6 @@
 """Shared utilities for API routers."""
 
-from .error_handling import handle_http_exceptions, handle_repository_errors
-from .validators import verify_flow_exists
+from .error_handling import register_exception_handlers
+from .validators import get_flow_run_or_404, verify_flow_exists
 
-__all__ = ["handle_http_exceptions", "handle_repository_errors", "verify_flow_exists"]
+__all__ = ["get_flow_run_or_404", "register_exception_handlers", "verify_flow_exists"]
@@ -4,8 +4,8 @@ Defines a structured representation for council agent metadata and exposes a
 central registry consumable by routers and services.
 """
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, replace
+from functools import lru_cache
 
 from app.backend.api.schemas import AgentInfo
 
@@ -20,7 +20,7 @@ class AgentMetadata:
         Human-friendly agent name.
     type : str
         Agent category/type identifier.
-    traits : list[str]
+    traits : tuple[str, ...]
         Highlighted traits or tags.
     specialty : str
         Primary area of expertise.
@@ -30,7 +30,7 @@ class AgentMetadata:
 
     name: str
     type: str
-    traits: list[str]
+    traits: tuple[str, ...]
     specialty: str
     system_prompt: str
 
@@ -39,7 +39,7 @@ AGENT_METADATA: dict[str, AgentMetadata] = {
     "satoshi_nakamoto": AgentMetadata(
         name="Satoshi Nakamoto",
         type="crypto_visionary",
-        traits=["Decentralization", "Sound Money", "Privacy"],
+        traits=("Decentralization", "Sound Money", "Privacy"),
         specialty="Bitcoin philosophy and decentralization",
         system_prompt=(
             "You are Satoshi Nakamoto, creator of Bitcoin, focusing on decentralization and sound money principles."
@@ -48,14 +48,14 @@ AGENT_METADATA: dict[str, AgentMetadata] = {
     "vitalik_buterin": AgentMetadata(
         name="Vitalik Buterin",
         type="ethereum_founder",
-        traits=["Innovation", "Smart Contracts", "DeFi"],
+        traits=("Innovation", "Smart Contracts", "DeFi"),
         specialty="Ethereum ecosystem and smart contracts",
         system_prompt=("You are Vitalik Buterin, focusing on programmable blockchain and decentralized applications."),
     ),
     "defi_agent": AgentMetadata(
         name="DeFi Agent",
         type="analyst",
-        traits=["DeFi", "Liquidity Pools", "Yield Farming"],
+        traits=("DeFi", "Liquidity Pools", "Yield Farming"),
         specialty=("Decentralized finance protocols, DEXs, and yield strategies"),
         system_prompt=(
             "You are a DeFi-focused analyst covering AMMs, lending, liquid staking, and on-chain liquidity dynamics."
@@ -64,51 +64,66 @@ AGENT_METADATA: dict[str, AgentMetadata] = {
     "michael_saylor": AgentMetadata(
         name="Michael Saylor",
         type="institutional_advisor",
-        traits=[
+        traits=(
             "Corporate Strategy",
             "Store of Value",
             "Institutional Adoption",
-        ],
+        ),
         specialty=("Bitcoin as digital gold and corporate treasury"),
         system_prompt=("You are Michael Saylor, CEO of MicroStrategy, focusing on Bitcoin as a store of value."),
     ),
     "cz_binance": AgentMetadata(
         name="CZ (Changpeng Zhao)",
         type="exchange_expert",
-        traits=["Market Efficiency", "Liquidity", "Trading"],
+        traits=("Market Efficiency", "Liquidity", "Trading"),
         specialty="Exchange dynamics and market structure",
         system_prompt=("You are CZ, founder of Binance, focusing on market efficiency and liquidity."),
     ),
     "elon_musk": AgentMetadata(
         name="Elon Musk",
         type="disruptor",
-        traits=["Innovation", "Memes", "Social Impact"],
+        traits=("Innovation", "Memes", "Social Impact"),
         specialty="Technology disruption and viral adoption",
         system_prompt=("You are Elon Musk, focusing on technological disruption and mass adoption."),
     ),
     "crypto_technical": AgentMetadata(
         name="Technical Analyst",
         type="technical_analyst",
-        traits=["Technical Analysis", "Chart Patterns", "Indicators"],
+        traits=("Technical Analysis", "Chart Patterns", "Indicators"),
         specialty="Technical analysis and chart patterns",
         system_prompt=("You are a technical analyst focusing on chart patterns and indicators."),
     ),
     "crypto_sentiment": AgentMetadata(
         name="Sentiment Analyst",
         type="sentiment_analyst",
-        traits=["Social Media", "News", "Market Sentiment"],
+        traits=("Social Media", "News", "Market Sentiment"),
         specialty="Market sentiment and social analysis",
         system_prompt=("You are a sentiment analyst focusing on social media and news sentiment."),
     ),
     "crypto_analyst": AgentMetadata(
         name="Crypto Analyst",
         type="fundamental_analyst",
-        traits=["Fundamental Analysis", "On-chain Data", "Valuation"],
+        traits=("Fundamental Analysis", "On-chain Data", "Valuation"),
         specialty="Fundamental analysis and on-chain metrics",
         system_prompt=("You are a fundamental analyst focusing on on-chain data and valuation."),
     ),
 }
 
+# Default AgentInfo per registered agent, shared by every caller (AgentInfo is frozen)
+AGENT_INFO_TEMPLATES: dict[str, AgentInfo] = {
+    agent_key: AgentInfo(
+        id=agent_key,
+        name=meta.name,
+        type=meta.type,
+        role="analyst",
+        traits=meta.traits,
+        specialty=meta.specialty,
+        system_prompt=meta.system_prompt,
+        position=None,
+    )
+    for agent_key, meta in AGENT_METADATA.items()
+}
+
 
 def normalize_agent_list(raw_agents: list[dict] | dict | None) -> list[dict] | None:
     """Normalize agents payload from DB to a flat list if present.
@@ -124,32 +139,41 @@ def normalize_agent_list(raw_agents: list[dict] | dict | None) -> list[dict] | N
     list[dict] | None
         A flat list of agent dicts if available, otherwise None.
     """
-    if raw_agents is None:
-        return None
-    agents_data: Any = raw_agents
-    if isinstance(agents_data, dict) and "agents" in agents_data:
-        agents_data = agents_data["agents"]
-    return agents_data if isinstance(agents_data, list) else None
+    if isinstance(raw_agents, list):
+        return raw_agents
+    if isinstance(raw_agents, dict):
+        agents = raw_agents.get("agents")
+        return agents if isinstance(agents, list) else None
+    return None
+
+
+@lru_cache(maxsize=256)
+def get_registered_agent_info(agent_key: str, role: str) -> AgentInfo:
+    """Get the shared AgentInfo for a registered agent acting in the given role."""
+    template = AGENT_INFO_TEMPLATES[agent_key]
+    return template if role == template.role else replace(template, role=role)
 
 
 def create_agent_info(agent_data: dict) -> AgentInfo:
     """Convert raw agent JSON into AgentInfo using registry metadata when available."""
     agent_key = agent_data.get("agent_key") or agent_data.get("id", "")
-    meta = AGENT_METADATA.get(agent_key)
+    role = agent_data.get("role", "analyst")
+    position = agent_data.get("position")
 
-    name = meta.name if meta else agent_key.replace("_", " ").title()
-    agent_type = meta.type if meta else "analyst"
-    traits = meta.traits if meta else None
-    specialty = meta.specialty if meta else None
-    system_prompt = meta.system_prompt if meta else None
+    template = AGENT_INFO_TEMPLATES.get(agent_key)
+    if template is not None:
+        # Registered agents without a per-council position share one instance per role
+        if position is None and isinstance(role, str):
+            return get_registered_agent_info(agent_key, role)
+        return replace(template, role=role, position=position)
 
     return AgentInfo(
         id=agent_key,
-        name=name,
-        type=agent_type,
-        role=agent_data.get("role", "analyst"),
-        traits=traits,
-        specialty=specialty,
-        system_prompt=system_prompt,
-        position=agent_data.get("position"),
+        name=agent_key.replace("_", " ").title(),
+        type="analyst",
+        role=role,
+        traits=None,
+        specialty=None,
+        system_prompt=None,
+        position=position,
     )
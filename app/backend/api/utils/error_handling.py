@@ -1,48 +1,133 @@
 """Common error handling utilities for API routers."""
 
+import logging
+
 import structlog
-from fastapi import HTTPException
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = structlog.get_logger(__name__)
 
 
-def handle_http_exceptions(func):
+def log_endpoint_error(event: str, request: Request, exc: Exception) -> None:
     """
-    Decorator to handle HTTP exceptions consistently.
+    Log an endpoint error without formatting its traceback unless debug logging is on.
+
+    Formatting tracebacks dominates the cost of the error path when many requests fail at
+    once (e.g. during a database outage), so only the error type and message are logged.
 
-    Re-raises HTTPException, wraps other exceptions as 500 errors.
+    Parameters
+    ----------
+    event : str
+        Log event message
+    request : Request
+        Request that raised the error
+    exc : Exception
+        Error being handled
     """
+    logger.error(event, path=request.url.path, error_type=type(exc).__name__, error=str(exc))
+    if logging.getLogger(__name__).isEnabledFor(logging.DEBUG):
+        logger.debug("Endpoint error traceback", path=request.url.path, exc_info=exc)
 
-    async def wrapper(*args, **kwargs):
-        try:
-            return await func(*args, **kwargs)
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.exception("Unexpected error in endpoint", endpoint=func.__name__, error=str(e))
-            raise HTTPException(status_code=500, detail=f"An error occurred: {e!s}") from e
 
-    return wrapper
+async def repository_error_handler(request: Request, exc: SQLAlchemyError) -> JSONResponse:
+    """
+    Convert SQLAlchemy errors raised by any endpoint into a 500 response.
 
+    Parameters
+    ----------
+    request : Request
+        Request that raised the error
+    exc : SQLAlchemyError
+        Database error
 
-def handle_repository_errors(func):
+    Returns
+    -------
+    JSONResponse
+        Generic database failure response
     """
-    Decorator to handle repository/database errors consistently.
+    log_endpoint_error("Database error in endpoint", request, exc)
+    return JSONResponse(status_code=500, content={"detail": "Database operation failed"})
 
-    Converts SQLAlchemy errors and other database errors to appropriate HTTP responses.
+
+async def unhandled_error_handler(request: Request, exc: Exception) -> JSONResponse:
     """
+    Convert any other unhandled endpoint error into a 500 response.
+
+    Called from UnhandledErrorMiddleware; HTTPException and request validation errors keep
+    FastAPI's own handlers.
+
+    Parameters
+    ----------
+    request : Request
+        Request that raised the error
+    exc : Exception
+        Unhandled error
+
+    Returns
+    -------
+    JSONResponse
+        Error response carrying the exception message
+    """
+    log_endpoint_error("Unexpected error in endpoint", request, exc)
+    return JSONResponse(status_code=500, content={"detail": f"An error occurred: {exc!s}"})
+
+
+class UnhandledErrorMiddleware:
+    """
+    Turn exceptions that no exception handler claimed into a logged 500 response.
+
+    Starlette runs handlers registered for ``Exception`` in ServerErrorMiddleware, outside
+    CORSMiddleware and after which the error is re-raised to the server. This middleware
+    sits inside CORSMiddleware instead, so the 500 keeps its CORS headers and the error is
+    not logged a second time with a full traceback.
+
+    Parameters
+    ----------
+    app : ASGIApp
+        Wrapped application
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the wrapped application and answer unhandled HTTP errors with a 500."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking_start(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
 
-    async def wrapper(*args, **kwargs):
         try:
-            return await func(*args, **kwargs)
-        except HTTPException:
-            raise
-        except SQLAlchemyError as e:
-            logger.exception("Database error in endpoint", endpoint=func.__name__, error=str(e))
-            raise HTTPException(status_code=500, detail="Database operation failed") from e
-        except Exception as e:
-            logger.exception("Unexpected error in repository operation", endpoint=func.__name__, error=str(e))
-            raise HTTPException(status_code=500, detail=f"Repository operation failed: {e!s}") from e
-
-    return wrapper
+            await self.app(scope, receive, send_tracking_start)
+        except Exception as exc:
+            # A streamed response that already sent headers can't be replaced
+            if response_started:
+                raise
+            response = await unhandled_error_handler(Request(scope), exc)
+            await response(scope, receive, send)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Install the shared endpoint error handlers on the application.
+
+    Errors are translated once at the application level instead of wrapping every endpoint.
+    Must be called before CORSMiddleware is added so error responses keep their CORS headers.
+
+    Parameters
+    ----------
+    app : FastAPI
+        Application to configure
+    """
+    app.add_exception_handler(SQLAlchemyError, repository_error_handler)
+    app.add_middleware(UnhandledErrorMiddleware)
@@ -1,6 +1,6 @@
 """Validation utilities for API routers."""
 
-from app.backend.db.models import HedgeFundFlow
+from app.backend.db.models import HedgeFundFlow, HedgeFundFlowRun
 from app.backend.db.uow import UnitOfWork
 from fastapi import HTTPException
 
@@ -22,6 +22,37 @@ async def verify_flow_exists(uow: UnitOfWork, flow_id: int) -> None:
         If flow is not found (404)
     """
     flow_repo = uow.get_repository(HedgeFundFlow)
-    flow = await flow_repo.get_flow_by_id(flow_id)
-    if not flow:
+    if not await flow_repo.exists_by_id(flow_id):
         raise HTTPException(status_code=404, detail="Flow not found")
+
+
+async def get_flow_run_or_404(uow: UnitOfWork, flow_id: int, run_id: int) -> HedgeFundFlowRun:
+    """
+    Fetch a flow run, verifying its flow exists in the same query.
+
+    Parameters
+    ----------
+    uow : UnitOfWork
+        Unit of work instance
+    flow_id : int
+        Flow ID the run must belong to
+    run_id : int
+        Run ID to fetch
+
+    Returns
+    -------
+    HedgeFundFlowRun
+        The requested flow run
+
+    Raises
+    ------
+    HTTPException
+        If the flow or the run is not found (404)
+    """
+    run_repo = uow.get_repository(HedgeFundFlowRun)
+    flow_exists, flow_run = await run_repo.get_run_for_flow(flow_id, run_id)
+    if not flow_exists:
+        raise HTTPException(status_code=404, detail="Flow not found")
+    if flow_run is None:
+        raise HTTPException(status_code=404, detail="Flow run not found")
+    return flow_run
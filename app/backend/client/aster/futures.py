@@ -6,19 +6,33 @@ Base URL: https://fapi.asterdex.com
 
 import hashlib
 import hmac
-import json
 import time
 from typing import Any
 from urllib.parse import urlencode
 
 import aiohttp
+import orjson
 import structlog
 from app.backend.config.aster import get_aster_settings
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from yarl import URL
 
 logger = structlog.get_logger(__name__)
 aster_settings = get_aster_settings()
 
+# Connection pool sizing for the single Aster API host
+CONNECTION_POOL_LIMIT = 100
+CONNECTION_POOL_LIMIT_PER_HOST = 32
+# Seconds resolved DNS entries are cached
+DNS_CACHE_TTL_SECONDS = 300
+# Seconds an idle connection is kept open for reuse (aiohttp's default is 15)
+KEEPALIVE_TIMEOUT_SECONDS = 75
+
+SUPPORTED_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+# Methods whose parameters are sent in the query string rather than the form body
+QUERY_STRING_HTTP_METHODS = frozenset({"GET", "DELETE"})
+FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+
 
 class AsterFuturesError(Exception):
     """Base exception for Aster Futures API errors."""
@@ -161,6 +175,14 @@ class Income(BaseModel):
     trade_id: str | None = None
 
 
+# List adapters validate whole responses in one pydantic-core call instead of one model call per row
+ORDER_LIST_ADAPTER = TypeAdapter(list[Order])
+FUTURES_ACCOUNT_BALANCE_LIST_ADAPTER = TypeAdapter(list[FuturesAccountBalance])
+POSITION_LIST_ADAPTER = TypeAdapter(list[Position])
+TRADE_LIST_ADAPTER = TypeAdapter(list[Trade])
+INCOME_LIST_ADAPTER = TypeAdapter(list[Income])
+
+
 class AsterFuturesClient:
     """Aster Futures API client implementing the official API specification.
 
@@ -199,15 +221,28 @@ class AsterFuturesClient:
         """
         self.api_key = api_key or aster_settings.api_key
         self.api_secret = api_secret or aster_settings.api_secret
+        # Keyed once; each signature copies this state instead of re-deriving the key pads
+        self._hmac_template = (
+            hmac.new(self.api_secret.encode("utf-8"), digestmod=hashlib.sha256) if self.api_secret else None
+        )
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.session: aiohttp.ClientSession | None = None
+        # Parsed endpoint URLs, filled on first use so aiohttp doesn't re-parse them per request
+        self._endpoint_urls: dict[str, URL] = {}
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=self.timeout)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            # Keep connections and DNS results warm so bursts skip TCP/TLS handshakes
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTION_POOL_LIMIT,
+                limit_per_host=CONNECTION_POOL_LIMIT_PER_HOST,
+                ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+                keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+            )
+            self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
         return self.session
 
     async def close(self) -> None:
@@ -232,9 +267,18 @@ class AsterFuturesClient:
 
     def _generate_signature(self, query_string: str) -> str:
         """Generate HMAC SHA256 signature for signed endpoints."""
-        if not self.api_secret:
+        if self._hmac_template is None:
             raise AuthenticationError(-1015, "API secret is required for signed endpoints")
-        return hmac.new(self.api_secret.encode("utf-8"), query_string.encode("utf-8"), hashlib.sha256).hexdigest()
+        signer = self._hmac_template.copy()
+        signer.update(query_string.encode("utf-8"))
+        return signer.hexdigest()
+
+    def _endpoint_url(self, endpoint: str) -> URL:
+        """Get the parsed full URL for an endpoint path, caching it per client."""
+        url = self._endpoint_urls.get(endpoint)
+        if url is None:
+            url = self._endpoint_urls[endpoint] = URL(f"{self.base_url}{endpoint}")
+        return url
 
     def _build_params(self, **kwargs: Any) -> dict[str, Any]:
         """Build params dict, excluding None values."""
@@ -279,39 +323,39 @@ class AsterFuturesClient:
         if params is None:
             params = {}
 
+        url = self._endpoint_url(endpoint)
+        headers: dict[str, str] = {}
+        signed_query: str | None = None
+
         # Add timestamp and signature for signed endpoints
         if signed:
             if not self.api_key:
                 raise AuthenticationError(-1015, "API key is required for signed endpoints")
-            params["timestamp"] = int(time.time() * 1000)
+            params["timestamp"] = time.time_ns() // 1_000_000
             query_string = urlencode(sorted(params.items()))
-            params["signature"] = self._generate_signature(query_string)
-
-        url = f"{self.base_url}{endpoint}"
-        headers: dict[str, str] = {}
-
-        if signed and self.api_key:
+            # Sent verbatim below, so the server sees exactly the bytes that were signed
+            signed_query = f"{query_string}&signature={self._generate_signature(query_string)}"
             headers["X-MBX-APIKEY"] = self.api_key
 
         session = await self._get_session()
-        method_map = {
-            "GET": session.get,
-            "POST": session.post,
-            "PUT": session.put,
-            "DELETE": session.delete,
-        }
 
         try:
-            if method not in method_map:
+            if method not in SUPPORTED_HTTP_METHODS:
                 raise ValueError(f"Unsupported HTTP method: {method}")
-            http_method = method_map[method]
-            request_kwargs = {"headers": headers}
-            if method in {"GET", "DELETE"}:
-                request_kwargs["params"] = params
-            else:
+            request_kwargs: dict[str, Any] = {"headers": headers}
+            if method in QUERY_STRING_HTTP_METHODS:
+                if signed_query is None:
+                    request_kwargs["params"] = params
+                else:
+                    # Already percent-encoded; stop aiohttp from re-encoding the query
+                    url = URL(f"{url}?{signed_query}", encoded=True)
+            elif signed_query is None:
                 request_kwargs["data"] = params
+            else:
+                headers["Content-Type"] = FORM_CONTENT_TYPE
+                request_kwargs["data"] = signed_query.encode()
 
-            async with http_method(url, **request_kwargs) as response:
+            async with session.request(method, url, **request_kwargs) as response:
                 return await self._handle_response(response)
 
         except aiohttp.ClientError as e:
@@ -331,7 +375,12 @@ class AsterFuturesClient:
         if response.status == 418:
             raise RateLimitError(-1023, "IP auto-banned for continuing to send requests after receiving 429 codes")
 
-        data = await response.json()
+        # Decode the raw body with orjson rather than aiohttp's stdlib-based json()
+        body = await response.read()
+        try:
+            data = orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            raise AsterFuturesError(-1, f"Invalid JSON response: HTTP {response.status}") from e
 
         # Check for API error response
         if "code" in data and data["code"] != 200:
@@ -664,9 +713,9 @@ class AsterFuturesClient:
         """
         if len(batch_orders) > 5:
             raise ValueError("Maximum 5 orders allowed in batch")
-        params = {"batchOrders": json.dumps(batch_orders)}
+        params = {"batchOrders": orjson.dumps(batch_orders).decode()}
         result = await self._request("POST", "/fapi/v1/batchOrders", params, signed=True)
-        return [Order(**order) for order in result]
+        return ORDER_LIST_ADAPTER.validate_python(result)
 
     async def query_order(
         self, symbol: str, order_id: int | None = None, orig_client_order_id: str | None = None
@@ -723,11 +772,11 @@ class AsterFuturesClient:
         """
         params: dict[str, Any] = {"symbol": symbol}
         if order_id_list:
-            params["orderIdList"] = json.dumps(order_id_list)
+            params["orderIdList"] = orjson.dumps(order_id_list).decode()
         if orig_client_order_id_list:
-            params["origClientOrderIdList"] = json.dumps(orig_client_order_id_list)
+            params["origClientOrderIdList"] = orjson.dumps(orig_client_order_id_list).decode()
         result = await self._request("DELETE", "/fapi/v1/batchOrders", params, signed=True)
-        return [Order(**order) for order in result]
+        return ORDER_LIST_ADAPTER.validate_python(result)
 
     async def auto_cancel_all_open_orders(self, symbol: str, countdown_time: int) -> dict[str, Any]:
         """
@@ -760,7 +809,7 @@ class AsterFuturesClient:
         """Current All Open Orders (USER_DATA)."""
         params = self._build_params(symbol=symbol)
         result = await self._request("GET", "/fapi/v1/openOrders", params, signed=True)
-        return [Order(**order) for order in result]
+        return ORDER_LIST_ADAPTER.validate_python(result)
 
     async def get_all_orders(
         self,
@@ -775,7 +824,7 @@ class AsterFuturesClient:
             symbol=symbol, orderId=order_id, startTime=start_time, endTime=end_time, limit=limit
         )
         result = await self._request("GET", "/fapi/v1/allOrders", params, signed=True)
-        return [Order(**order) for order in result]
+        return ORDER_LIST_ADAPTER.validate_python(result)
 
     async def get_futures_account_balance_v2(self) -> list[FuturesAccountBalance]:
         """
@@ -787,7 +836,7 @@ class AsterFuturesClient:
             List of account balances
         """
         result = await self._request("GET", "/fapi/v2/balance", signed=True)
-        return [FuturesAccountBalance(**balance) for balance in result]
+        return FUTURES_ACCOUNT_BALANCE_LIST_ADAPTER.validate_python(result)
 
     async def get_account_information_v4(self) -> AccountInformation:
         """
@@ -864,7 +913,7 @@ class AsterFuturesClient:
         """Position Information V2 (USER_DATA)."""
         params = self._build_params(symbol=symbol)
         result = await self._request("GET", "/fapi/v2/positionRisk", params, signed=True)
-        return [Position(**position) for position in result]
+        return POSITION_LIST_ADAPTER.validate_python(result)
 
     async def get_account_trade_list(
         self,
@@ -877,7 +926,7 @@ class AsterFuturesClient:
         """Account Trade List (USER_DATA)."""
         params = self._build_params(symbol=symbol, startTime=start_time, endTime=end_time, fromId=from_id, limit=limit)
         result = await self._request("GET", "/fapi/v1/userTrades", params, signed=True)
-        return [Trade(**trade) for trade in result]
+        return TRADE_LIST_ADAPTER.validate_python(result)
 
     async def get_income_history(
         self,
@@ -892,7 +941,7 @@ class AsterFuturesClient:
             symbol=symbol, incomeType=income_type, startTime=start_time, endTime=end_time, limit=limit
         )
         result = await self._request("GET", "/fapi/v1/income", params, signed=True)
-        return [Income(**income) for income in result]
+        return INCOME_LIST_ADAPTER.validate_python(result)
 
     async def get_notional_and_leverage_brackets(self, symbol: str | None = None) -> list[dict[str, Any]]:
         """Notional and Leverage Brackets (USER_DATA)."""
@@ -107,11 +107,11 @@ class AsterClient:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self._close_client()
+        self.close()
 
     def __del__(self):
         """Cleanup client on garbage collection."""
-        self._close_client()
+        self.close()
 
     def _initialize_client(self) -> None:
         """Initialize the Aster REST client."""
@@ -136,7 +136,7 @@ class AsterClient:
         except Exception as e:
             raise RuntimeError(f"Failed to initialize Aster client: {e}") from e
 
-    def _close_client(self) -> None:
+    def close(self) -> None:
         """Close and cleanup the Aster REST client."""
         if self._client is not None:
             if hasattr(self._client, "close") and callable(self._client.close):
@@ -193,6 +193,26 @@ class AsterClient:
         except Exception as e:
             raise RuntimeError(f"Failed to get ticker for {symbol}: {e}") from e
 
+    def get_all_tickers(self) -> dict[str, float]:
+        """
+        Get latest prices for all symbols in a single request.
+
+        Returns
+        -------
+        dict[str, float]
+            Mapping of symbol to latest price
+        """
+        try:
+            result = self._client.ticker_price()  # type: ignore[attr-defined]
+            return {row["symbol"]: float(row["price"]) for row in result}
+
+        except ClientError as e:
+            raise RuntimeError(f"Aster API client error: {e.error_message}") from e
+        except ServerError as e:
+            raise RuntimeError(f"Aster API server error: {e}") from e
+        except Exception as e:
+            raise RuntimeError(f"Failed to get all tickers: {e}") from e
+
     def get_klines(self, symbol: str, interval: str = "1h", limit: int = 100) -> list[AsterOHLCV]:
         """
         Get historical kline/candlestick data.
@@ -475,6 +495,11 @@ class AsterClient:
         loop = asyncio.get_event_loop()
         return await loop.run_in_executor(None, self.get_ticker, symbol)
 
+    async def aget_all_tickers(self) -> dict[str, float]:
+        """Async wrapper for get_all_tickers."""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self.get_all_tickers)
+
     async def aget_klines(self, symbol: str, interval: str = "1h", limit: int = 100) -> list[AsterOHLCV]:
         """Async wrapper for get_klines."""
         loop = asyncio.get_event_loop()
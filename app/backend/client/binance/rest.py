@@ -1,6 +1,7 @@
 """Binance Testnet Futures REST API client."""
 
 import asyncio
+import contextlib
 import hashlib
 import hmac
 import time
@@ -103,6 +104,7 @@ class BinanceClient:
         config: BinanceConfig | None = None,
         *,
         enable_rate_limiting: bool = True,
+        session: aiohttp.ClientSession | None = None,
     ):
         """
         Initialize Binance Futures client.
@@ -113,6 +115,9 @@ class BinanceClient:
             Binance client configuration. If None, loads from settings.
         enable_rate_limiting : bool
             Enable client-side rate limiting (default: True)
+        session : aiohttp.ClientSession | None
+            Long-lived HTTP session reused for every request; the caller owns and closes it.
+            If None, each request opens and closes its own session.
         """
         if config is None:
             config = binance_settings
@@ -123,6 +128,7 @@ class BinanceClient:
         self.api_secret = config.api_secret
         self.timeout = config.timeout
         self.recv_window = config.recv_window
+        self.session = session
 
         # Rate limiting
         self.enable_rate_limiting = enable_rate_limiting
@@ -228,7 +234,10 @@ class BinanceClient:
         # Retry logic with exponential backoff
         for attempt in range(max_retries):
             try:
-                async with aiohttp.ClientSession() as session:
+                # Reuse the injected session's connection pool; otherwise use a throwaway session
+                async with (
+                    contextlib.nullcontext(self.session) if self.session is not None else aiohttp.ClientSession()
+                ) as session:
                     request_kwargs = {
                         "url": url,
                         "params": params,
@@ -344,6 +353,23 @@ class BinanceClient:
             logger.exception("Failed to get ticker", symbol=symbol, error=str(e))
             raise
 
+    async def aget_all_tickers(self) -> dict[str, float]:
+        """
+        Get latest prices for all symbols in a single request.
+
+        Returns
+        -------
+        dict[str, float]
+            Mapping of symbol to latest price
+        """
+        try:
+            data = await self._request("GET", "/fapi/v1/ticker/price", weight=2)
+        except Exception as e:
+            logger.exception("Failed to get all tickers", error=str(e))
+            raise
+
+        return {row["symbol"]: float(row["price"]) for row in data}
+
     async def aget_symbol_info(self, symbol: str) -> dict[str, Any]:
         """
         Get exchange metadata for a specific symbol.
@@ -0,0 +1,52 @@
+"""Process-wide exchange clients."""
+
+import aiohttp
+import structlog
+from app.backend.client.aster import AsterClient
+from app.backend.client.binance import BinanceClient
+from app.backend.config.binance import BinanceConfig
+
+logger = structlog.get_logger(__name__)
+
+
+class ExchangeClients:
+    """
+    Exchange clients configured from environment credentials, shared per process.
+
+    Clients are created on first use and reused across requests so that
+    connection pools and rate limiter state are not rebuilt on every call.
+    The Binance client shares one long-lived HTTP session owned here.
+    Clients built from per-wallet credentials are not cached here.
+    """
+
+    def __init__(self) -> None:
+        self._binance_testnet: BinanceClient | None = None
+        self._binance_session: aiohttp.ClientSession | None = None
+        self._aster: AsterClient | None = None
+
+    @property
+    def binance_testnet(self) -> BinanceClient:
+        """Binance Futures testnet client (paper trading)."""
+        if self._binance_testnet is None:
+            self._binance_session = aiohttp.ClientSession()
+            self._binance_testnet = BinanceClient(BinanceConfig(testnet=True), session=self._binance_session)
+        return self._binance_testnet
+
+    @property
+    def aster(self) -> AsterClient:
+        """Aster client (real trading)."""
+        if self._aster is None:
+            self._aster = AsterClient()
+        return self._aster
+
+    async def close(self):
+        """Release the shared exchange clients."""
+        if self._aster is not None:
+            self._aster.close()
+            self._aster = None
+
+        if self._binance_session is not None:
+            await self._binance_session.close()
+            self._binance_session = None
+        self._binance_testnet = None
+        logger.debug("Exchange clients closed")
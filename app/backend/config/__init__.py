@@ -4,6 +4,7 @@ from app.backend.config.api import get_api_settings
 from app.backend.config.aster import get_aster_settings
 from app.backend.config.database import get_database_settings
 from app.backend.config.llm import get_llm_settings
+from app.backend.config.redis import get_redis_settings
 from app.backend.config.twitter import get_twitter_settings
 from dotenv import load_dotenv
 
@@ -14,5 +15,6 @@ __all__ = [
     "get_aster_settings",
     "get_database_settings",
     "get_llm_settings",
+    "get_redis_settings",
     "get_twitter_settings",
 ]
@@ -0,0 +1,24 @@
+"""Redis cache configuration."""
+
+from functools import lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class RedisSettings(BaseSettings):
+    """Connection settings for the Redis response/market-data cache."""
+
+    model_config = SettingsConfigDict(env_prefix="REDIS_", case_sensitive=False)
+
+    url: str = Field(default="redis://localhost:6379/0", description="Redis connection URL")
+    enabled: bool = Field(default=True, description="Disable to bypass the cache entirely")
+    max_connections: int = Field(default=50, description="Maximum connections in the Redis pool")
+    socket_timeout: float = Field(default=0.5, description="Socket timeout in seconds for cache operations")
+    socket_connect_timeout: float = Field(default=0.5, description="Connect timeout in seconds")
+
+
+@lru_cache
+def get_redis_settings() -> RedisSettings:
+    """Return cached Redis settings loaded from environment variables."""
+    return RedisSettings()
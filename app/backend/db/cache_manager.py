@@ -0,0 +1,128 @@
+"""Redis Cache Manager."""
+
+import structlog
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = structlog.get_logger(__name__)
+
+
+class CacheManager:
+    """
+    Redis cache manager with a shared connection pool.
+
+    Every operation degrades to a cache miss when Redis is disabled or
+    unreachable, so callers can always fall back to the source of truth.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        enabled: bool = True,
+        max_connections: int = 50,
+        socket_timeout: float = 0.5,
+        socket_connect_timeout: float = 0.5,
+    ) -> None:
+        self._client: Redis | None = None
+        if enabled:
+            self._client = Redis.from_url(
+                url,
+                max_connections=max_connections,
+                socket_timeout=socket_timeout,
+                socket_connect_timeout=socket_connect_timeout,
+            )
+
+    async def close(self):
+        """Close the Redis connection pool."""
+        if self._client is None:
+            return
+
+        await self._client.aclose()
+        self._client = None
+
+    async def aget(self, key: str) -> bytes | None:
+        """
+        Get a cached value.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+
+        Returns
+        -------
+        bytes | None
+            Cached value, or None on miss or cache failure
+        """
+        if self._client is None:
+            return None
+
+        try:
+            return await self._client.get(key)
+        except RedisError as e:
+            logger.debug("Cache get failed", key=key, error=str(e))
+            return None
+
+    async def amget(self, keys: list[str]) -> list[bytes | None]:
+        """
+        Get several cached values in a single round-trip.
+
+        Parameters
+        ----------
+        keys : list[str]
+            Cache keys
+
+        Returns
+        -------
+        list[bytes | None]
+            Cached values aligned with ``keys`` (None for misses)
+        """
+        if self._client is None or not keys:
+            return [None] * len(keys)
+
+        try:
+            return await self._client.mget(keys)
+        except RedisError as e:
+            logger.debug("Cache mget failed", keys=len(keys), error=str(e))
+            return [None] * len(keys)
+
+    async def aset(self, key: str, value: bytes | str, ttl: float) -> None:
+        """
+        Store a value with a time-to-live.
+
+        Parameters
+        ----------
+        key : str
+            Cache key
+        value : bytes | str
+            Value to store
+        ttl : float
+            Time-to-live in seconds (sub-second values are supported)
+        """
+        if self._client is None:
+            return
+
+        try:
+            await self._client.set(key, value, px=int(ttl * 1000))
+        except RedisError as e:
+            logger.debug("Cache set failed", key=key, error=str(e))
+
+    async def adelete_pattern(self, pattern: str) -> None:
+        """
+        Delete every key matching a glob pattern.
+
+        Parameters
+        ----------
+        pattern : str
+            Glob-style key pattern (e.g. ``councils:system:*``)
+        """
+        if self._client is None:
+            return
+
+        try:
+            keys = [key async for key in self._client.scan_iter(match=pattern)]
+            if keys:
+                await self._client.delete(*keys)
+        except RedisError as e:
+            logger.warning("Cache invalidation failed", pattern=pattern, error=str(e))
@@ -92,3 +92,20 @@ class FuturesPosition(SQLModel, table=True):
         default=None, sa_column=Column(DateTime(timezone=True), server_default=text("now()"), nullable=False)
     )
     meta_data: dict | None = Field(default=None, sa_column=Column(JSONB, nullable=True))
+
+    @property
+    def normalized_side(self) -> str:
+        """
+        Position side for API responses ("long" or "short").
+
+        Binance one-way mode reports "BOTH"; the direction then follows the sign
+        of ``position_amt``.
+
+        Returns
+        -------
+        str
+            Lowercase position side
+        """
+        if self.position_side.upper() == "BOTH":
+            return "long" if self.position_amt > 0 else "short"
+        return self.position_side.lower()
@@ -76,6 +76,21 @@ class ApiKeyRepository(AbstractSqlRepository[ApiKey]):
         """
         return await self.find_by(is_active=True)
 
+    async def get_active_provider_key_map(self) -> dict[str, str]:
+        """
+        Get active API keys as a provider-to-key mapping.
+
+        Selects only the two needed columns, so no ORM objects are built.
+
+        Returns
+        -------
+        dict[str, str]
+            Mapping of provider name to key value.
+        """
+        stmt = select(ApiKey.provider, ApiKey.key_value).where(ApiKey.is_active.is_(True))
+        result = await self.session.execute(stmt)
+        return dict(result.tuples().all())
+
     async def update_key_status(
         self,
         key_id: int,
@@ -1,5 +1,6 @@
 """Repository for unified Council operations."""
 
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 
@@ -7,8 +8,10 @@ from app.backend.db.models import AgentDebate
 from app.backend.db.models.consensus import ConsensusDecision
 from app.backend.db.models.council import Council, CouncilRun, CouncilRunCycle
 from app.backend.db.repositories.base_repository import AbstractSqlRepository
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import Float, Row, and_, case, cast, column, func, or_, select, true
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
 
 class CouncilRepository(AbstractSqlRepository[Council]):
@@ -193,6 +196,57 @@ class CouncilRepository(AbstractSqlRepository[Council]):
         council = result.scalar_one_or_none()
         return self._load_all_attributes(council) if council else None
 
+    async def get_council_agents_config(self, council_id: int) -> list | dict | None:
+        """
+        Get only the agents JSON of a council, without loading the full row.
+
+        Parameters
+        ----------
+        council_id : int
+            Council ID
+
+        Returns
+        -------
+        list | dict | None
+            Agents configuration, or None if the council doesn't exist
+        """
+        result = await self.session.execute(select(Council.agents).where(Council.id == council_id))
+        return result.scalar_one_or_none()
+
+    async def get_council_agent_config(self, council_id: int, agent_id: str) -> dict | None:
+        """
+        Get a single agent configuration from a council's agents array.
+
+        The element is matched inside PostgreSQL with ``jsonb_array_elements`` so
+        only the requested agent is transferred.
+
+        Parameters
+        ----------
+        council_id : int
+            Council ID
+        agent_id : str
+            Agent ID within the council
+
+        Returns
+        -------
+        dict | None
+            Agent configuration, or None if the council or agent doesn't exist
+        """
+        # Object-shaped agents configs expand to no rows instead of raising
+        agents_array = case(
+            (func.jsonb_typeof(Council.agents) == "array", Council.agents),
+            else_=func.jsonb_build_array(),
+        )
+        agent = func.jsonb_array_elements(agents_array).table_valued(column("value", JSONB)).lateral("agent")
+        result = await self.session.execute(
+            select(agent.c.value)
+            .select_from(Council)
+            .join(agent, true())
+            .where(Council.id == council_id, agent.c.value["id"].astext == agent_id)
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
     async def get_user_councils(
         self,
         user_id: int,
@@ -230,16 +284,28 @@ class CouncilRepository(AbstractSqlRepository[Council]):
         councils = list(result.scalars().all())
         return [self._load_all_attributes(c) for c in councils]
 
-    async def get_system_councils(self) -> list[Council]:
+    async def get_system_councils(self, columns: list[str] | None = None) -> list[Council]:
         """
         Get all system councils (pre-made templates).
 
+        Parameters
+        ----------
+        columns : list[str] | None
+            Load only these columns; other attributes stay unloaded and must not
+            be accessed. Loads every column when omitted.
+
         Returns
         -------
         list[Council]
             System councils
         """
-        result = await self.session.execute(select(Council).where(Council.is_system.is_(True)).order_by(Council.name))
+        query = select(Council).where(Council.is_system.is_(True)).order_by(Council.name)
+        if columns is not None:
+            query = query.options(load_only(*(getattr(Council, name) for name in columns)))
+            result = await self.session.execute(query)
+            return list(result.scalars().all())
+
+        result = await self.session.execute(query)
         councils = list(result.scalars().all())
         return [self._load_all_attributes(c) for c in councils]
 
@@ -666,6 +732,36 @@ class CouncilRepository(AbstractSqlRepository[Council]):
         )
         return list(result.scalars().all())
 
+    async def get_recent_debates_global(self, council_ids: list[int], limit: int = 50) -> list:
+        """
+        Get the most recent debates across several councils.
+
+        Sorting and limiting happen in SQL, so at most ``limit`` rows are returned
+        regardless of how many councils are requested.
+
+        Parameters
+        ----------
+        council_ids : list[int]
+            Council IDs
+        limit : int
+            Maximum number of debates to return
+
+        Returns
+        -------
+        list
+            List of AgentDebate objects, newest first
+        """
+        if not council_ids:
+            return []
+
+        result = await self.session.execute(
+            select(AgentDebate)
+            .where(AgentDebate.council_id.in_(council_ids))
+            .order_by(AgentDebate.created_at.desc())
+            .limit(limit)
+        )
+        return list(result.scalars().all())
+
     async def create_debate_message(
         self,
         council_id: int,
@@ -902,6 +998,7 @@ class CouncilRepository(AbstractSqlRepository[Council]):
         self,
         council_id: int,
         limit: int = 100,
+        since: datetime | None = None,
     ) -> list:
         """
         Get performance history for a council.
@@ -912,6 +1009,8 @@ class CouncilRepository(AbstractSqlRepository[Council]):
             Council ID
         limit : int
             Maximum number of snapshots to return
+        since : datetime | None
+            Only include snapshots taken at or after this time
 
         Returns
         -------
@@ -920,14 +1019,60 @@ class CouncilRepository(AbstractSqlRepository[Council]):
         """
         from app.backend.db.models import CouncilPerformance
 
-        result = await self.session.execute(
-            select(CouncilPerformance)
-            .where(CouncilPerformance.council_id == council_id)
-            .order_by(CouncilPerformance.timestamp.desc())
-            .limit(limit)
-        )
+        query = select(CouncilPerformance).where(CouncilPerformance.council_id == council_id)
+        if since is not None:
+            query = query.where(CouncilPerformance.timestamp >= since)
+
+        result = await self.session.execute(query.order_by(CouncilPerformance.timestamp.desc()).limit(limit))
         return list(result.scalars().all())
 
+    async def stream_performance_history(
+        self,
+        council_id: int,
+        limit: int = 100,
+        since: datetime | None = None,
+    ) -> AsyncIterator[Row]:
+        """
+        Stream performance history for a council from a server-side cursor.
+
+        Numeric columns are cast to double precision in SQL so rows arrive as
+        plain floats, ready for JSON serialization without per-row Decimal
+        conversion. Use ``get_performance_history`` where exact decimals matter.
+
+        Parameters
+        ----------
+        council_id : int
+            Council ID
+        limit : int
+            Maximum number of snapshots to return
+        since : datetime | None
+            Only include snapshots taken at or after this time
+
+        Yields
+        ------
+        Row
+            Snapshots shaped like ``PerformanceDataPoint``, newest first
+        """
+        from app.backend.db.models import CouncilPerformance
+
+        query = select(
+            CouncilPerformance.timestamp,
+            cast(CouncilPerformance.total_value, Float).label("total_value"),
+            cast(CouncilPerformance.pnl, Float).label("pnl"),
+            cast(CouncilPerformance.pnl_percentage, Float).label("pnl_percentage"),
+            func.nullif(cast(CouncilPerformance.win_rate, Float), 0).label("win_rate"),
+            func.coalesce(CouncilPerformance.total_trades, 0).label("total_trades"),
+            func.coalesce(CouncilPerformance.open_positions, 0).label("open_positions"),
+        ).where(CouncilPerformance.council_id == council_id)
+        if since is not None:
+            query = query.where(CouncilPerformance.timestamp >= since)
+
+        result = await self.session.stream(
+            query.order_by(CouncilPerformance.timestamp.desc()).limit(limit).execution_options(yield_per=500)
+        )
+        async for row in result:
+            yield row
+
     async def get_council_account_values(
         self,
         days: int = 72,
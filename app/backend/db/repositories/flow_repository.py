@@ -4,7 +4,7 @@ from typing import Any
 
 from app.backend.db.models import HedgeFundFlow
 from app.backend.db.repositories.base_repository import AbstractSqlRepository
-from sqlalchemy import select
+from sqlalchemy import RowMapping, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -72,7 +72,7 @@ class FlowRepository(AbstractSqlRepository[HedgeFundFlow]):
             tags=tags or [],
         )
 
-    async def get_flows_by_name(self, name: str) -> list[HedgeFundFlow]:
+    async def get_flows_by_name(self, name: str, limit: int | None = 100) -> list[HedgeFundFlow]:
         """
         Get flows by name pattern.
 
@@ -80,17 +80,21 @@ class FlowRepository(AbstractSqlRepository[HedgeFundFlow]):
         ----------
         name : str
             Name pattern to search for.
+        limit : int | None, optional
+            Maximum number of flows to return, by default 100.
 
         Returns
         -------
         list[HedgeFundFlow]
-            List of matching flows.
+            List of matching flows, most recently updated first.
         """
         # Use __table__.c for SQLAlchemy column operations like ilike() and desc()
+        # The substring match is served by the trigram index on name (migration 0031)
         stmt = (
             select(HedgeFundFlow)
             .where(HedgeFundFlow.__table__.c.name.ilike(f"%{name}%"))
             .order_by(HedgeFundFlow.__table__.c.updated_at.desc())
+            .limit(limit)
         )
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
@@ -140,6 +144,32 @@ class FlowRepository(AbstractSqlRepository[HedgeFundFlow]):
             return list(result.scalars().all())
         return await self.get_user_flows()
 
+    async def get_flow_summaries(self, columns: list[str], *, include_templates: bool = True) -> list[RowMapping]:
+        """
+        Get only the given columns of every flow, most recently updated first.
+
+        Rows are returned as mappings without building ORM objects, so large
+        nodes/edges payloads are never fetched unless requested.
+
+        Parameters
+        ----------
+        columns : list[str]
+            Flow column names to select.
+        include_templates : bool, optional
+            Whether to include template flows, by default True.
+
+        Returns
+        -------
+        list[RowMapping]
+            One mapping of column name to value per flow.
+        """
+        table = HedgeFundFlow.__table__
+        stmt = select(*(table.c[name] for name in columns)).order_by(table.c.updated_at.desc())
+        if not include_templates:
+            stmt = stmt.where(table.c.is_template.is_(False))
+        result = await self.session.execute(stmt)
+        return list(result.mappings().all())
+
     async def get_flow_by_id(self, flow_id: int) -> HedgeFundFlow | None:
         """
         Get a flow by its ID.
@@ -157,6 +187,25 @@ class FlowRepository(AbstractSqlRepository[HedgeFundFlow]):
         # Delegate to base repository method
         return await self.get_by_id(flow_id)
 
+    async def exists_by_id(self, flow_id: int) -> bool:
+        """
+        Check whether a flow exists without loading it.
+
+        Parameters
+        ----------
+        flow_id : int
+            Flow ID to check.
+
+        Returns
+        -------
+        bool
+            True if the flow exists, False otherwise.
+        """
+        # Select a constant so the nodes/edges JSON is never read or hydrated
+        stmt = select(literal(1)).where(HedgeFundFlow.id == flow_id).limit(1)
+        result = await self.session.execute(stmt)
+        return result.scalar() is not None
+
     async def delete_flow(self, flow_id: int) -> bool:
         """
         Delete a flow by its ID.
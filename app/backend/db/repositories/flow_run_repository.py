@@ -2,11 +2,13 @@
 
 from typing import Any
 
-from app.backend.db.models import HedgeFundFlowRun
+from app.backend.db.models import HedgeFundFlow, HedgeFundFlowRun
 from app.backend.db.repositories.base_repository import AbstractSqlRepository
-from sqlalchemy import select
+from sqlalchemy import RowMapping, and_, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+ACTIVE_RUN_STATUSES = ["RUNNING", "IN_PROGRESS", "STARTED"]
+
 
 class FlowRunRepository(AbstractSqlRepository[HedgeFundFlowRun]):
     """Repository for HedgeFundFlowRun CRUD operations."""
@@ -55,21 +57,146 @@ class FlowRunRepository(AbstractSqlRepository[HedgeFundFlowRun]):
             initial_portfolio=initial_portfolio,
         )
 
-    async def get_runs_by_flow_id(self, flow_id: int) -> list[HedgeFundFlowRun]:
+    async def get_runs_by_flow_id(
+        self,
+        flow_id: int,
+        limit: int | None = None,
+        offset: int = 0,
+        before_id: int | None = None,
+    ) -> list[HedgeFundFlowRun]:
         """
-        Get all runs for a specific flow.
+        Get runs for a specific flow, newest first.
 
         Parameters
         ----------
         flow_id : int
             Flow ID to search for.
+        limit : int | None, optional
+            Maximum number of runs to return, by default all.
+        offset : int, optional
+            Number of runs to skip, by default 0.
+        before_id : int | None, optional
+            Keyset cursor: only return runs with a lower ID, by default None.
 
         Returns
         -------
         list[HedgeFundFlowRun]
             List of runs for the flow.
         """
-        return await self.find_by(flow_id=flow_id)
+        stmt = select(HedgeFundFlowRun).where(HedgeFundFlowRun.flow_id == flow_id)
+        if before_id is not None:
+            stmt = stmt.where(HedgeFundFlowRun.id < before_id)
+
+        stmt = stmt.order_by(HedgeFundFlowRun.id.desc()).offset(offset).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_run_summaries_by_flow_id(
+        self,
+        flow_id: int,
+        columns: list[str],
+        limit: int | None = None,
+        offset: int = 0,
+        before_id: int | None = None,
+    ) -> list[RowMapping]:
+        """
+        Get only the given columns of a flow's runs, newest first.
+
+        Rows are returned as mappings without building ORM objects, so the
+        request_data/results payloads are never fetched unless requested.
+
+        Parameters
+        ----------
+        flow_id : int
+            Flow ID to search for.
+        columns : list[str]
+            Run column names to select.
+        limit : int | None, optional
+            Maximum number of runs to return, by default all.
+        offset : int, optional
+            Number of runs to skip, by default 0.
+        before_id : int | None, optional
+            Keyset cursor: only return runs with a lower ID, by default None.
+
+        Returns
+        -------
+        list[RowMapping]
+            One mapping of column name to value per run.
+        """
+        table = HedgeFundFlowRun.__table__
+        stmt = select(*(table.c[name] for name in columns)).where(table.c.flow_id == flow_id)
+        if before_id is not None:
+            stmt = stmt.where(table.c.id < before_id)
+
+        stmt = stmt.order_by(table.c.id.desc()).offset(offset).limit(limit)
+        result = await self.session.execute(stmt)
+        return list(result.mappings().all())
+
+    async def count_runs_by_flow_id(self, flow_id: int) -> int:
+        """
+        Count runs for a specific flow.
+
+        Parameters
+        ----------
+        flow_id : int
+            Flow ID to count runs for.
+
+        Returns
+        -------
+        int
+            Number of runs for the flow.
+        """
+        stmt = select(func.count()).select_from(HedgeFundFlowRun).where(HedgeFundFlowRun.flow_id == flow_id)
+        return await self.session.scalar(stmt)
+
+    async def delete_by_flow_id(self, flow_id: int) -> int:
+        """
+        Delete all runs for a specific flow in a single statement.
+
+        Parameters
+        ----------
+        flow_id : int
+            Flow ID whose runs should be deleted.
+
+        Returns
+        -------
+        int
+            Number of runs deleted.
+        """
+        stmt = delete(HedgeFundFlowRun).where(HedgeFundFlowRun.flow_id == flow_id)
+        result = await self.session.execute(stmt)
+        await self.session.commit()
+        return result.rowcount
+
+    async def get_run_for_flow(self, flow_id: int, run_id: int) -> tuple[bool, HedgeFundFlowRun | None]:
+        """
+        Get a run belonging to a flow, checking the flow exists in the same query.
+
+        Parameters
+        ----------
+        flow_id : int
+            Flow ID the run must belong to.
+        run_id : int
+            Run ID to fetch.
+
+        Returns
+        -------
+        tuple[bool, HedgeFundFlowRun | None]
+            Whether the flow exists, and the run if it exists and belongs to the flow.
+        """
+        stmt = (
+            select(HedgeFundFlow.id, HedgeFundFlowRun)
+            .select_from(HedgeFundFlow)
+            .outerjoin(
+                HedgeFundFlowRun,
+                and_(HedgeFundFlowRun.id == run_id, HedgeFundFlowRun.flow_id == HedgeFundFlow.id),
+            )
+            .where(HedgeFundFlow.id == flow_id)
+        )
+        row = (await self.session.execute(stmt)).first()
+        if row is None:
+            return False, None
+        return True, row[1]
 
     async def get_runs_by_status(self, status: str) -> list[HedgeFundFlowRun]:
         """
@@ -96,10 +223,33 @@ class FlowRunRepository(AbstractSqlRepository[HedgeFundFlowRun]):
         list[HedgeFundFlowRun]
             List of active runs.
         """
-        stmt = select(HedgeFundFlowRun).where(HedgeFundFlowRun.status.in_(["RUNNING", "IN_PROGRESS", "STARTED"]))
+        stmt = select(HedgeFundFlowRun).where(HedgeFundFlowRun.status.in_(ACTIVE_RUN_STATUSES))
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_active_run_for_flow(self, flow_id: int) -> HedgeFundFlowRun | None:
+        """
+        Get the active run for a specific flow.
+
+        Parameters
+        ----------
+        flow_id : int
+            Flow ID to search for.
+
+        Returns
+        -------
+        HedgeFundFlowRun | None
+            Most recent active run if found, None otherwise.
+        """
+        stmt = (
+            select(HedgeFundFlowRun)
+            .where(HedgeFundFlowRun.flow_id == flow_id, HedgeFundFlowRun.status.in_(ACTIVE_RUN_STATUSES))
+            .order_by(HedgeFundFlowRun.id.desc())
+            .limit(1)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalars().first()
+
     async def update_run_status(
         self,
         run_id: int,
@@ -77,6 +77,38 @@ class FuturesPositionRepository(AbstractSqlRepository[FuturesPosition]):
         result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def find_recent_closed_positions(self, council_ids: list[int], limit: int = 100) -> list[FuturesPosition]:
+        """
+        Find the most recently opened closed positions across several councils.
+
+        Parameters
+        ----------
+        council_ids : list[int]
+            Council IDs
+        limit : int
+            Maximum number of results
+
+        Returns
+        -------
+        list[FuturesPosition]
+            Closed positions, newest first by open time
+        """
+        if not council_ids:
+            return []
+
+        query = (
+            select(FuturesPosition)
+            .where(
+                FuturesPosition.council_id.in_(council_ids),
+                FuturesPosition.status.in_(["CLOSED", "LIQUIDATED"]),
+            )
+            .order_by(FuturesPosition.opened_at.desc())
+            .limit(limit)
+        )
+
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
     async def find_all_positions(self, council_id: int) -> list[FuturesPosition]:
         """
         Find all positions for a council.
@@ -2,21 +2,40 @@
 
 import structlog
 from app.backend.api import router as api_router
-from app.backend.config import get_api_settings
+from app.backend.api.utils import register_exception_handlers
+from app.backend.client.exchange_clients import ExchangeClients
+from app.backend.config import get_api_settings, get_redis_settings
+from app.backend.db.cache_manager import CacheManager
 from app.backend.db.session_manager import session_manager
+from app.backend.src.agents.streaming_agent import WorkflowEngine
 from app.backend.utils.middlewares.profiling_middleware import ProfilingMiddleware
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 api_settings = get_api_settings()
 logger = structlog.stdlib.get_logger(__name__)
 
 
-async def lifespan(_: FastAPI):
+async def lifespan(app: FastAPI):
     """Application lifespan events."""
+    redis_settings = get_redis_settings()
+    app.state.cache_manager = CacheManager(
+        redis_settings.url,
+        enabled=redis_settings.enabled,
+        max_connections=redis_settings.max_connections,
+        socket_timeout=redis_settings.socket_timeout,
+        socket_connect_timeout=redis_settings.socket_connect_timeout,
+    )
+    app.state.exchange_clients = ExchangeClients()
+    # Shared so start/stop/status calls from every endpoint see the same workflow state
+    app.state.workflow_engine = WorkflowEngine()
+
     yield
 
     await session_manager.close()
+    await app.state.cache_manager.close()
+    await app.state.exchange_clients.close()
 
 
 app = FastAPI(
@@ -27,9 +46,14 @@ app = FastAPI(
     redoc_url=None,  # Disable ReDoc
     openapi_url=None,  # Disable OpenAPI schema endpoint
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
-# Configure CORS - MUST be added first before other middleware
+# Translate endpoint errors into JSON responses in one place; registered before CORS so
+# the error middleware runs inside it and 500 responses still carry CORS headers
+register_exception_handlers(app)
+
+# Configure CORS - MUST be added before the other custom middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=api_settings.cors_origins,
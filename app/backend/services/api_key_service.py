@@ -12,8 +12,7 @@ class ApiKeyService:
 
     async def get_api_keys_dict(self) -> dict[str, str]:
         """Return all active API keys as a provider-to-key mapping."""
-        api_keys = await self.repository.get_all_api_keys(include_inactive=False)
-        return {key.provider: key.key_value for key in api_keys}
+        return await self.repository.get_active_provider_key_map()
 
     async def get_api_key(self, provider: str) -> str | None:
         """Fetch a single API key value by provider identifier."""
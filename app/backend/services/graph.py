@@ -41,7 +41,8 @@ class GraphService:
         self._graphs = {}
         self._agent_service = AgentService()
 
-    def extract_base_agent_key(self, unique_id: str) -> str:
+    @staticmethod
+    def extract_base_agent_key(unique_id: str) -> str:
         """
         Extract the base agent key from a unique node ID.
 
@@ -437,7 +438,8 @@ class GraphService:
             },
         )
 
-    def parse_hedge_fund_response(self, response: str) -> dict | None:
+    @staticmethod
+    def parse_hedge_fund_response(response: str) -> dict | None:
         """
         Parse a JSON string and return a dictionary.
 
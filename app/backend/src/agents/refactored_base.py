@@ -6,7 +6,7 @@ TODO: This is a stub implementation to fix import errors.
 
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AgentConfig(BaseModel):
@@ -23,7 +23,4 @@ class AgentConfig(BaseModel):
     max_tokens: int | None = None
     additional_params: dict[str, Any] | None = None
 
-    class Config:
-        """Pydantic configuration."""
-
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
@@ -79,5 +79,8 @@ done
 cd ../..
 
 # Start the FastAPI server
+# WebSocket broadcasts are serialized once and fanned out; per-message deflate would
+# recompress every frame per client and hold a compressor for each connection
 echo -e "${GREEN}Starting FastAPI server...${NC}"
-exec uv run uvicorn app.backend.main:app --host 0.0.0.0 --port 8000
+exec uv run uvicorn app.backend.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools \
+    --ws-per-message-deflate false
@@ -0,0 +1,32 @@
+"""Unit tests for CacheManager."""
+
+import pytest
+
+from app.backend.db.cache_manager import CacheManager
+
+
+class TestCacheManager:
+    """Test Redis cache manager fallbacks."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_cache_is_always_a_miss(self):
+        """Test disabled cache returns misses and ignores writes."""
+        cache = CacheManager("redis://localhost:6379/0", enabled=False)
+
+        await cache.aset("councils:system:v1", b"[]", ttl=30)
+
+        assert await cache.aget("councils:system:v1") is None
+        assert await cache.amget(["a", "b"]) == [None, None]
+        await cache.adelete_pattern("councils:system:*")
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_redis_degrades_to_miss(self):
+        """Test connection failures are swallowed as cache misses."""
+        cache = CacheManager("redis://127.0.0.1:1/0", socket_connect_timeout=0.1)
+
+        await cache.aset("ticker:binance:BTCUSDT", "50000", ttl=3)
+
+        assert await cache.aget("ticker:binance:BTCUSDT") is None
+        assert await cache.amget(["ticker:binance:BTCUSDT"]) == [None]
+        await cache.close()
@@ -0,0 +1,65 @@
+"""Tests for the shared API error handling."""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import OperationalError
+from structlog.testing import capture_logs
+
+from app.backend.api.utils import register_exception_handlers
+
+ORIGIN = "http://localhost:5173"
+
+
+def create_app() -> FastAPI:
+    """Create an app wired like main.py with routes that fail."""
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.add_middleware(
+        CORSMiddleware, allow_origins=[ORIGIN], allow_methods=["*"], allow_headers=["*"]
+    )
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/db")
+    async def db():
+        raise OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+    return app
+
+
+@pytest.fixture
+async def client():
+    """HTTP client that would re-raise any exception escaping the application."""
+    transport = httpx.ASGITransport(app=create_app(), raise_app_exceptions=True)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestErrorHandling:
+    """Test unhandled and database errors become CORS-enabled JSON 500 responses."""
+
+    async def test_unhandled_error_keeps_cors_headers(self, client):
+        """Test an unhandled error is answered inside CORS and not re-raised."""
+        with capture_logs() as logs:
+            response = await client.get("/boom", headers={"Origin": ORIGIN})
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "An error occurred: boom"}
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert [log["event"] for log in logs] == ["Unexpected error in endpoint"]
+        assert logs[0]["error_type"] == "RuntimeError"
+        assert "exc_info" not in logs[0]
+
+    async def test_database_error_keeps_cors_headers(self, client):
+        """Test SQLAlchemy errors keep their dedicated handler."""
+        with capture_logs() as logs:
+            response = await client.get("/db", headers={"Origin": ORIGIN})
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Database operation failed"}
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert logs[0]["error_type"] == "OperationalError"
@@ -0,0 +1,45 @@
+"""Tests for the storage endpoints."""
+
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from app.backend.api.routers import storage
+
+
+@pytest.fixture
+async def client(tmp_path, monkeypatch):
+    """HTTP client for an app serving the storage router, writing into a temp directory."""
+    monkeypatch.setattr(storage, "get_outputs_dir", lambda: tmp_path)
+    app = FastAPI()
+    app.include_router(storage.router)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestSaveJson:
+    """Test that /storage/save-json only writes bare file names."""
+
+    @pytest.mark.parametrize(
+        "filename",
+        ["../x.json", "a/b.json", "a\\b.json", "/tmp/x.json", "", ".", ".."],
+    )
+    async def test_rejects_path_components(self, client, tmp_path, filename):
+        """Test filenames with path components are rejected before anything is written."""
+        response = await client.post(
+            "/storage/save-json", json={"filename": filename, "data": {"a": 1}}
+        )
+
+        assert response.status_code == 422
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_saves_plain_filename(self, client, tmp_path):
+        """Test a bare filename is written into the outputs directory."""
+        response = await client.post(
+            "/storage/save-json", json={"filename": "x.json", "data": {"a": 1}}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["filename"] == "x.json"
+        assert (tmp_path / "x.json").read_bytes() == b'{\n  "a": 1\n}'